@@ -1,16 +1,38 @@
-from typing import Optional, Union
+from typing import List, Optional, Union
+from http.cookies import SimpleCookie, CookieError
 import json
+import re
+import sys
 import xml.etree.ElementTree as ET
 
+try:
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
+
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+_UNSET = object()
+
 class Response:
+    __slots__ = (
+        'status_code', 'text', 'headers', 'content_type', '_content_type_lc',
+        '_status_class', '_cookie_jar', '_json', '_xml'
+    )
+
     def __init__(self, status_code: int, text: str, headers: dict, content_type: str):
         self.status_code = status_code
         self.text = text
         self.headers = headers
         self.content_type = content_type
+        self._content_type_lc = sys.intern(content_type.lower())
+        self._status_class = status_code // 100
+        self._cookie_jar: Optional[SimpleCookie] = None
+        self._json = _UNSET
+        self._xml = _UNSET
 
     def texts(self) -> Optional[str]:
-        if "text/plain" in self.content_type.lower():
+        if "text/plain" in self._content_type_lc:
             return self.text
         return None
 
@@ -18,15 +40,32 @@ class Response:
         return self.text
     
     def json(self) -> Optional[dict]:
-        try:
-            return json.loads(self.text)
-        except json.JSONDecodeError:
-            return None
+        if self._json is _UNSET:
+            try:
+                self._json = json.loads(self.text)
+            except json.JSONDecodeError:
+                self._json = None
+        return self._json
 
-    def xml(self) -> Optional[ET.Element]:
-        if "application/xml" in self.content_type:
-            return ET.fromstring(self.text)
-        return None
+    def xml(self) -> Optional[Union[ET.Element, "_etree._Element"]]:
+        """
+        Parse an ``application/xml`` body.
+
+        Returns an ``lxml.etree._Element`` when lxml is installed and an
+        ``xml.etree.ElementTree.Element`` otherwise; ``None`` for other
+        content types.
+        """
+        if self._xml is _UNSET:
+            if "application/xml" not in self._content_type_lc:
+                self._xml = None
+            elif _etree is not None:
+                # ``text`` is already decoded, so drop the declaration lxml
+                # would otherwise use to decode it a second time.
+                parser = _etree.XMLParser(resolve_entities=False, no_network=True)
+                self._xml = _etree.fromstring(_XML_DECLARATION.sub('', self.text, count=1), parser)
+            else:
+                self._xml = ET.fromstring(self.text)
+        return self._xml
 
     def header(self) -> dict:
         return self.headers
@@ -41,34 +80,45 @@ class Response:
         return self.headers.get(key)
 
     def is_success(self) -> bool:
-        return 200 <= self.status_code < 300
+        return self._status_class == 2
 
     def is_redirect(self) -> bool:
-        return 300 <= self.status_code < 400
+        return self._status_class == 3
 
     def is_client_error(self) -> bool:
-        return 400 <= self.status_code < 500
+        return self._status_class == 4
 
     def is_server_error(self) -> bool:
-        return 500 <= self.status_code < 600
+        return self._status_class == 5
 
     def has_header(self, key: str) -> bool:
         return key in self.headers
 
+    def _set_cookie_headers(self) -> List[str]:
+        get_all = getattr(self.headers, 'get_all', None)
+        if get_all is not None:
+            return get_all('Set-Cookie') or []
+        value = self.headers.get('Set-Cookie')
+        return [value] if value else []
+
+    def _get_cookie_jar(self) -> SimpleCookie:
+        if self._cookie_jar is None:
+            jar = SimpleCookie()
+            for value in self._set_cookie_headers():
+                try:
+                    jar.load(value)
+                except CookieError:
+                    pass
+            self._cookie_jar = jar
+        return self._cookie_jar
+
     def cookie(self, name: str) -> Union[str, None]:
-        cookies = self.headers.get('Set-Cookie', '').split(';')
-        for cookie in cookies:
-            parts = cookie.strip().split('=')
-            if len(parts) == 2 and parts[0] == name:
-                return parts[1]
-        return None
+        if not self._set_cookie_headers():
+            return None
+        morsel = self._get_cookie_jar().get(name)
+        return morsel.value if morsel is not None else None
 
     def cookies(self):
-        cookies = {}
-        cookie_header = self.headers.get('Set-Cookie', '')
-        cookie_parts = cookie_header.split(';')
-        for part in cookie_parts:
-            key_value = part.strip().split('=')
-            if len(key_value) == 2:
-                cookies[key_value[0]] = key_value[1]
-        return cookies
+        if not self._set_cookie_headers():
+            return {}
+        return {key: morsel.value for key, morsel in self._get_cookie_jar().items()}
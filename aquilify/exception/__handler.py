@@ -5,6 +5,7 @@ import traceback
 import html
 import typing
 from typing import Callable, Type
+from collections.abc import Mapping
 
 if typing.TYPE_CHECKING:
     from ..wrappers import Response, Request
@@ -14,10 +15,24 @@ from ._sys_info import get_sys_info
 
 ExceptionHandlers = dict[Type[Exception], Callable]
 exception_handlers: ExceptionHandlers = {}
+_handler_cache: ExceptionHandlers = {}
 
 
 def add_exception_handler(exception_cls: Type[Exception], handler: Callable):
     exception_handlers[exception_cls] = handler
+    _handler_cache.clear()
+
+
+def _lookup_handler(exception_cls: Type[Exception]) -> Callable:
+    handler = _handler_cache.get(exception_cls)
+    if handler is None:
+        handler = default_exception_handler
+        for cls in exception_cls.__mro__:
+            if cls in exception_handlers:
+                handler = exception_handlers[cls]
+                break
+        _handler_cache[exception_cls] = handler
+    return handler
 
 
 def get_code_lines():
@@ -81,9 +96,16 @@ def get_code_lines():
     return '\n'.join(relevant_code)
 
 
-async def default_exception_handler(error_message: str, traceback_info: str, code_lines, req_data = None) -> Response:
+async def default_exception_handler(
+    error_message: str,
+    get_traceback: Callable[[], str] = traceback.format_exc,
+    get_code: Callable[[], str] = get_code_lines,
+    req_data = None
+) -> Response:
     from ..wrappers import Response
     try:
+        traceback_info = get_traceback()
+        code_lines = get_code()
         formatted_traceback = "<br>".join(html.escape(line) for line in traceback_info.splitlines())
         error_type = traceback_info.splitlines()[-1].split(":")[0].strip()
 
@@ -106,39 +128,74 @@ async def default_exception_handler(error_message: str, traceback_info: str, cod
         error_message = f"Error in default exception handling: {str(e)}"
         return Response(content=error_message, content_type='text/plain', status_code=500)
 
+_MISSING = object()
+
+_REQUEST_DATA_GETTERS: dict[str, Callable] = {
+    "Host": lambda r, ua: r.host,
+    "Port": lambda r, ua: r.url.port,
+    "Client-IP": lambda r, ua: r.remote_addr,
+    "Path": lambda r, ua: r.path,
+    "Method": lambda r, ua: r.method,
+    "User-Agent-String": lambda r, ua: ua(),
+    "Browser": lambda r, ua: ua().browser,
+    "Timezone": lambda r, ua: ua().timezone,
+    "Language": lambda r, ua: ua().language,
+    "Platform": lambda r, ua: ua().platform,
+    "Query-Params": lambda r, ua: r.query_params,
+    "Base-Url": lambda r, ua: r.base_url,
+    "Origin": lambda r, ua: r.origin,
+    "Scheme": lambda r, ua: r.scheme,
+    "Referer": lambda r, ua: r.referer,
+    "Path-Params": lambda r, ua: r.path_param,
+    "Session": lambda r, ua: r.session,
+    "Cookie": lambda r, ua: r.cookies,
+}
+
+
+class _LazyRequestData(Mapping):
+    __slots__ = ('_request', '_cache', '_user_agent')
+
+    def __init__(self, request: Request) -> None:
+        self._request = request
+        self._cache: dict = {}
+        self._user_agent = None
+
+    def _get_user_agent(self):
+        if self._user_agent is None:
+            self._user_agent = self._request.user_agent
+        return self._user_agent
+
+    def __getitem__(self, key: str):
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            getter = _REQUEST_DATA_GETTERS[key]
+            try:
+                value = getter(self._request, self._get_user_agent)
+            except Exception as e:
+                # Rendering the error page must not fail on an unavailable
+                # field, e.g. Session without SessionMiddleware installed.
+                value = f"Unavailable ({type(e).__name__})"
+            self._cache[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(_REQUEST_DATA_GETTERS)
+
+    def __len__(self) -> int:
+        return len(_REQUEST_DATA_GETTERS)
+
+
 def request_data(request: Request = None):
     if request is None:
-        pass
-    req_data = {
-        "Host": request.host,
-        "Port": request.url.port,
-        "Client-IP": request.remote_addr,
-        "Path": request.path,
-        "Method": request.method,
-        "User-Agent-String": request.user_agent,
-        "Browser": request.user_agent.browser,
-        "Timezone": request.user_agent.timezone,
-        "Language": request.user_agent.language,
-        "Platform": request.user_agent.platform,
-        "Query-Params": request.query_params,
-        "Base-Url": request.base_url,
-        "Origin": request.origin,
-        "Scheme": request.scheme,
-        "Referer": request.referer,
-        "Path-Params": request.path_param,
-        "Session": request.session,
-        "Cookie": request.cookies
-    }
-    return req_data
+        return None
+    return _LazyRequestData(request)
 
 async def handle_exception(exception: Exception, request: Request = None) -> Response:
     try:
-        traceback_info = traceback.format_exc()
         error_message = f"{str(exception)}"
-        handler = exception_handlers.get(type(exception), default_exception_handler)
+        handler = _lookup_handler(type(exception))
         req_data = request_data(request)
-        return await handler(error_message, traceback_info, get_code_lines(), req_data)
+        return await handler(error_message, traceback.format_exc, get_code_lines, req_data)
     except Exception as e:
         error_message = f"{str(e)}"
-        traceback_info = traceback.format_exc()
-        return await default_exception_handler(error_message, traceback_info, get_code_lines())
+        return await default_exception_handler(error_message)
@@ -0,0 +1,6 @@
+from .__handler import (
+    add_exception_handler as add_exception_handler,
+    default_exception_handler as default_exception_handler,
+    exception_handlers as exception_handlers,
+    handle_exception as handle_exception,
+)
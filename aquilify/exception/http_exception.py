@@ -4,6 +4,8 @@ import warnings
 
 __all__ = ("HTTPException", "WebSocketException")
 
+_STATUS_PHRASES = {status.value: status.phrase for status in http.HTTPStatus}
+
 
 class HTTPException(Exception):
     def __init__(
@@ -13,7 +15,7 @@ class HTTPException(Exception):
         headers: typing.Optional[dict] = None,
     ) -> None:
         if detail is None:
-            detail = http.HTTPStatus(status_code).phrase
+            detail = _STATUS_PHRASES.get(status_code, "")
         self.status_code = status_code
         self.detail = detail
         self.headers = headers
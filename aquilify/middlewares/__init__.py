@@ -1,22 +1,60 @@
-from .cors import CORS as CORSMiddleware
-from .limiter import RateLimiter as RateLimiterMiddleware
-from .static import StaticMiddleware
-from .dispatcher import Dispatcher
-from .profiler import AquilifyProfiler as Profiler
-from .csp import CSPMiddleware
-from .proxyfix import ProxyFix as ProxyFix
-from .httpsredirect import HTTPSRedirectMiddleware
-from .trustedhost import TrustedhostMiddleware
-from .gzip import GzipMiddleware
-from .logger import LoggingMiddleware
-from .timeout import TimeoutMiddleware
-from .compression import CompressionMiddleware
-from .xfameoption import XFrameOptionsMiddleware
-from .csrfmiddleware import CSRFMiddleware as CSRFMiddleware
-from .media import MediaMiddleware as MediaMiddleware
-from .hstsmiddleware import HSTSMiddleware as HSTSMiddleware
-from .admin import ConsoleAPI as TestConsoleAPI
-from .conditional_get import ConditionalGetMiddleware as ConditionalGetMiddleware
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from .cors import CORS as CORSMiddleware
+    from .limiter import RateLimiter as RateLimiterMiddleware
+    from .static import StaticMiddleware
+    from .dispatcher import Dispatcher
+    from .profiler import AquilifyProfiler as Profiler
+    from .csp import CSPMiddleware
+    from .proxyfix import ProxyFix as ProxyFix
+    from .httpsredirect import HTTPSRedirectMiddleware
+    from .trustedhost import TrustedhostMiddleware
+    from .gzip import GzipMiddleware
+    from .logger import LoggingMiddleware
+    from .timeout import TimeoutMiddleware
+    from .compression import CompressionMiddleware
+    from .xfameoption import XFrameOptionsMiddleware
+    from .csrfmiddleware import CSRFMiddleware as CSRFMiddleware
+    from .media import MediaMiddleware as MediaMiddleware
+    from .hstsmiddleware import HSTSMiddleware as HSTSMiddleware
+    from .admin import ConsoleAPI as TestConsoleAPI
+    from .conditional_get import ConditionalGetMiddleware as ConditionalGetMiddleware
+
+_LAZY_IMPORTS = {
+    'CORSMiddleware': ('.cors', 'CORS'),
+    'RateLimiterMiddleware': ('.limiter', 'RateLimiter'),
+    'StaticMiddleware': ('.static', 'StaticMiddleware'),
+    'Dispatcher': ('.dispatcher', 'Dispatcher'),
+    'Profiler': ('.profiler', 'AquilifyProfiler'),
+    'CSPMiddleware': ('.csp', 'CSPMiddleware'),
+    'ProxyFix': ('.proxyfix', 'ProxyFix'),
+    'HTTPSRedirectMiddleware': ('.httpsredirect', 'HTTPSRedirectMiddleware'),
+    'TrustedhostMiddleware': ('.trustedhost', 'TrustedhostMiddleware'),
+    'GzipMiddleware': ('.gzip', 'GzipMiddleware'),
+    'LoggingMiddleware': ('.logger', 'LoggingMiddleware'),
+    'TimeoutMiddleware': ('.timeout', 'TimeoutMiddleware'),
+    'CompressionMiddleware': ('.compression', 'CompressionMiddleware'),
+    'XFrameOptionsMiddleware': ('.xfameoption', 'XFrameOptionsMiddleware'),
+    'CSRFMiddleware': ('.csrfmiddleware', 'CSRFMiddleware'),
+    'MediaMiddleware': ('.media', 'MediaMiddleware'),
+    'HSTSMiddleware': ('.hstsmiddleware', 'HSTSMiddleware'),
+    'TestConsoleAPI': ('.admin', 'ConsoleAPI'),
+    'ConditionalGetMiddleware': ('.conditional_get', 'ConditionalGetMiddleware'),
+}
+
+def __getattr__(name: str) -> typing.Any:
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'CORSMiddleware',
@@ -25,7 +63,7 @@ __all__ = [
     'Dispatcher',
     'Profiler',
     'CSPMiddleware',
-    'ProxyFixer',
+    'ProxyFix',
     'HTTPSRedirectMiddleware',
     'TrustedhostMiddleware',
     'GzipMiddleware',
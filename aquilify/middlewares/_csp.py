@@ -6,11 +6,59 @@ import logging
 import secrets
 import hashlib
 from pathlib import Path
-from typing import Dict, Union, List, Optional
+from typing import Dict, Union, List, Optional, Tuple
 
 from ..wrappers import Request, Response
 from ..exception.__handler import handle_exception
 
+def build_static_headers(
+    referrer_policy: str,
+    hsts_max_age: int,
+    hsts_include_subdomains: bool,
+    hsts_preload: bool,
+    feature_policy: Dict[str, str],
+    x_content_type_options: str,
+    x_frame_options: str,
+    x_xss_protection: str,
+    expect_ct: Optional[str] = None,
+    cross_origin_opener_policy: Optional[str] = None,
+    cross_origin_embedder_policy: Optional[str] = None,
+    referrer_policy_feature: bool = False,
+    referrer_policy_no_referer: bool = False,
+    referrer_policy_no_referrer_when_downgrade: bool = False,
+) -> Tuple[Tuple[str, str], ...]:
+    """Security headers that do not vary per request, shared by both CSP middlewares."""
+    headers: List[Tuple[str, str]] = []
+    if expect_ct:
+        headers.append(("Expect-CT", expect_ct))
+    if cross_origin_opener_policy:
+        headers.append(("Cross-Origin-Opener-Policy", cross_origin_opener_policy))
+    if cross_origin_embedder_policy:
+        headers.append(("Cross-Origin-Embedder-Policy", cross_origin_embedder_policy))
+
+    if referrer_policy_no_referrer_when_downgrade:
+        referrer_policy = referrer_policy + ", " + "no-referrer-when-downgrade"
+    elif referrer_policy_no_referer:
+        referrer_policy = referrer_policy + ", " + "no-referer"
+    elif referrer_policy_feature:
+        referrer_policy = referrer_policy + ", " + "features"
+    headers.append(("Referrer-Policy", referrer_policy))
+
+    hsts_directive = f"max-age={hsts_max_age}"
+    if hsts_include_subdomains:
+        hsts_directive += "; includeSubDomains"
+    if hsts_preload:
+        hsts_directive += "; preload"
+    headers.append(("Strict-Transport-Security", hsts_directive))
+
+    if feature_policy:
+        headers.append(("Feature-Policy", " ".join(f"{key} {value}" for key, value in feature_policy.items())))
+
+    headers.append(("X-Content-Type-Options", x_content_type_options))
+    headers.append(("X-Frame-Options", x_frame_options))
+    headers.append(("X-XSS-Protection", x_xss_protection))
+    return tuple(headers)
+
 class CSPMiddleware:
     def __init__(
         self,
@@ -68,6 +116,22 @@ class CSPMiddleware:
         self.referrer_policy_feature: bool = referrer_policy_feature
         self.referrer_policy_no_referer: bool = referrer_policy_no_referer
         self.referrer_policy_no_referrer_when_downgrade: bool = referrer_policy_no_referrer_when_downgrade
+        self._static_headers = build_static_headers(
+            referrer_policy=self.referrer_policy,
+            hsts_max_age=self.hsts_max_age,
+            hsts_include_subdomains=self.hsts_include_subdomains,
+            hsts_preload=self.hsts_preload,
+            feature_policy=self.feature_policy,
+            x_content_type_options=self.x_content_type_options,
+            x_frame_options=self.x_frame_options,
+            x_xss_protection=self.x_xss_protection,
+            expect_ct=self.expect_ct,
+            cross_origin_opener_policy=self.cross_origin_opener_policy,
+            cross_origin_embedder_policy=self.cross_origin_embedder_policy,
+            referrer_policy_feature=self.referrer_policy_feature,
+            referrer_policy_no_referer=self.referrer_policy_no_referer,
+            referrer_policy_no_referrer_when_downgrade=self.referrer_policy_no_referrer_when_downgrade,
+        )
 
     async def __call__(self, request: Request, response: Response) -> Response:
         try:
@@ -83,39 +147,7 @@ class CSPMiddleware:
             response = self._set_csp_header(response)
             response = self._set_additional_security_headers(response)
 
-            if self.expect_ct:
-                response['headers']["Expect-CT"] = self.expect_ct
-
-            if self.cross_origin_opener_policy:
-                response['headers']["Cross-Origin-Opener-Policy"] = self.cross_origin_opener_policy
-
-            if self.cross_origin_embedder_policy:
-                response['headers']["Cross-Origin-Embedder-Policy"] = self.cross_origin_embedder_policy
-
-            if self.referrer_policy_feature:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "features"
-
-            if self.referrer_policy_no_referer:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "no-referer"
-
-            if self.referrer_policy_no_referrer_when_downgrade:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "no-referrer-when-downgrade"
-
-            response.headers["Referrer-Policy"] = self.referrer_policy
-            hsts_directive = f"max-age={self.hsts_max_age}"
-            if self.hsts_include_subdomains:
-                hsts_directive += "; includeSubDomains"
-            if self.hsts_preload:
-                hsts_directive += "; preload"
-            response.headers["Strict-Transport-Security"] = hsts_directive
-
-            if self.feature_policy:
-                feature_policy_directives = " ".join([f"{key} {value}" for key, value in self.feature_policy.items()])
-                response.headers["Feature-Policy"] = feature_policy_directives
-
-            response.headers["X-Content-Type-Options"] = self.x_content_type_options
-            response.headers["X-Frame-Options"] = self.x_frame_options
-            response.headers["X-XSS-Protection"] = self.x_xss_protection
+            response.headers.update(self._static_headers)
             return response
         except Exception as e:
             await handle_exception(e)
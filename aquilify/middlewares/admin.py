@@ -1,25 +1,11 @@
+import json
+from html import escape
+
 from aquilify.wrappers import Request, Response
 from aquilify.responses import HTMLResponse
 from aquilify.settings import settings
 
-class ConsoleAPI:
-    def __init__(self, app) -> None:
-        self.app = app
-        self.prefix = getattr(settings, 'API_CONSOLE_URL', '/console')
-        
-    async def __call__(self, request: Request, response: Response):
-        path: str = request.path
-        self.methods = None
-
-        if path.startswith(self.prefix):
-            response = HTMLResponse(await self.html_data(request))
-            return response
-        return response
-    
-    async def html_data(self, request: Request):
-        routes = self.app.routes
-
-        javascript_code = """
+_CONSOLE_ASSETS = """
             <script>
                 async function fetchData(url, method, outputId, queryParams) {
                     const outputBox = document.getElementById(outputId);
@@ -154,9 +140,9 @@ class ConsoleAPI:
                     margin-left: 10px;
                 }
             </style>
-        """
+"""
 
-        html_data = """
+_CONSOLE_HEADER = """
             <!DOCTYPE html>
             <html lang="en">
             <head>
@@ -169,51 +155,98 @@ class ConsoleAPI:
                 <button onclick="expandCollapseAll('block')">Expand All</button>
                 <button onclick="expandCollapseAll('none')">Collapse All</button>
                 <h3>Available Routes:</h3>
-        """
-
-        for index, route in enumerate(routes):
-            path, methods, _, _, _, _ = route
-            path = self.convert_regex_path(path)
-            output_id = f"response_{index}"  # Unique ID for each output box
-            
-            # HTML for each route container
-            route_html = f"""
+"""
+
+_CONSOLE_FOOTER = """
+                <button onclick="clearResponseBoxes()">Clear All Responses</button>
+            </body>
+            </html>
+"""
+
+class ConsoleAPI:
+    def __init__(self, app) -> None:
+        self.app = app
+        self.prefix = getattr(settings, 'API_CONSOLE_URL', '/console')
+        self._enabled = getattr(settings, 'DEBUG', False)
+        self._route_fragments = []
+        self._routes_version = -1
+        self._page_key = None
+        self._page_bytes = b''
+        
+    async def __call__(self, request: Request, response: Response):
+        if not self._enabled:
+            return response
+
+        path: str = request.path
+        self.methods = None
+
+        if path.startswith(self.prefix):
+            response = HTMLResponse(await self._page(request))
+            return response
+        return response
+
+    async def _page(self, request: Request) -> bytes:
+        key = (len(self.app.routes), request.scheme, request.host, str(request.query_params))
+        if key != self._page_key:
+            self._page_bytes = (await self.html_data(request)).encode('utf-8')
+            self._page_key = key
+        return self._page_bytes
+    
+    async def html_data(self, request: Request):
+        base_url = f"{request.scheme}://{request.host}"
+        query_params = str(request.query_params)
+        fields = {
+            'base_url': escape(base_url),
+            'base_url_js': escape(json.dumps(base_url)),
+            'query_params': escape(query_params),
+            'query_params_js': escape(json.dumps(query_params))
+        }
+        fragments = "".join(fragment.format(**fields) for fragment in self._get_route_fragments())
+        return _CONSOLE_ASSETS + _CONSOLE_HEADER + fragments + _CONSOLE_FOOTER
+
+    def _get_route_fragments(self):
+        routes = self.app.routes
+        if self._routes_version != len(routes):
+            self._route_fragments = [
+                self._build_route_fragment(index, route) for index, route in enumerate(routes)
+            ]
+            self._routes_version = len(routes)
+        return self._route_fragments
+
+    def _build_route_fragment(self, index, route):
+        path, methods, _, _, _, _ = route
+        path = self.convert_regex_path(path)
+        url_js = "{base_url_js} + " + escape(json.dumps(path)).replace('{', '{{').replace('}', '}}')
+        path = escape(path).replace('{', '{{').replace('}', '}}')
+        output_id = f"response_{index}"  # Unique ID for each output box
+        
+        # HTML for each route container
+        parts = [f"""
                 <div style="background-color: #f5f5f5; padding: 20px; margin-bottom: 10px;">
-                    <h4>PATH - '{path}' & URL - <u>{request.scheme}://{request.host}{path}</u></h4>
+                    <h4>PATH - '{path}' & URL - <u>{{base_url}}{path}</u></h4>
                     <div>
                         <label for="method_{index}">Method:</label>
-                        <select id="method_{index}" onchange="changeMethod('{request.scheme}://{request.host}{path}', this.value, '{output_id}')">
-            """
+                        <select id="method_{index}" onchange="changeMethod({url_js}, this.value, '{output_id}')">
+            """]
 
-            for method in methods:
-                route_html += f"<option value='{method}'>{method}</option>"
+        parts.extend(f"<option value='{escape(method)}'>{escape(method)}</option>" for method in methods)
 
-            route_html += "</select></div>"
-            route_html += f"""
+        parts.append("</select></div>")
+        parts.append(f"""
                 <div>
-                    <button onclick="fetchData('{request.scheme}://{request.host}{path}', document.getElementById('method_{index}').value, '{output_id}', '{str(request.query_params)}')">Fetch</button>
+                    <button onclick="fetchData({url_js}, document.getElementById('method_{index}').value, '{output_id}', {{query_params_js}})">Fetch</button>
                     <span class="toggle-headers" onclick="document.getElementById('{output_id + '_headers'}').style.display = (document.getElementById('{output_id + '_headers'}').style.display === 'block' ? 'none' : 'block')">Headers</span>
                     <span class="toggle-params" onclick="document.getElementById('{output_id + '_params'}').style.display = (document.getElementById('{output_id + '_params'}').style.display === 'block' ? 'none' : 'block')">Params</span>
                 </div>
                 <div id="{output_id}" class="response-box"></div>
                 <div id="{output_id + '_headers'}" class="headers-box"></div>
                 <div>
-                    <div id="{output_id + '_params'}" class="params-box">Query Params: {str(request.query_params)}</div>
+                    <div id="{output_id + '_params'}" class="params-box">Query Params: {{query_params}}</div>
                 </div>
-            """
-
-            route_html += "</div>"  # Close the route container
-            html_data += route_html  # Append the route HTML to the main HTML
-
-        # Finish the main HTML data
-        html_data += """
-                <button onclick="clearResponseBoxes()">Clear All Responses</button>
-            </body>
-            </html>
-        """
+            """)
 
-        final_data = f"{javascript_code}{html_data}"  # Combine JavaScript and HTML
-        return final_data
+        parts.append("</div>")  # Close the route container
+        return "".join(parts)
 
     def convert_regex_path(self, path):
         return path[1:-1] if path.startswith('^') and path.endswith('$') else path
\ No newline at end of file
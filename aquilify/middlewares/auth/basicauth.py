@@ -1,4 +1,5 @@
 import base64
+import hmac
 from aquilify.wrappers import Request, Response
 from typing import Optional, Dict, Any, Union
 
@@ -14,6 +15,8 @@ class BasicAuthBeforeStageHandler:
         self.unauthorized_message = "Unauthorized"
         self.auth_realm = 'Basic realm="Access to Aquilify"'
         self.protected_routes = protected_routes if isinstance(protected_routes, list) else [protected_routes]
+        self._protect_all = "*" in self.protected_routes
+        self._protected_routes = frozenset(route for route in self.protected_routes if route != "*")
         
         self._set_credentials(config, environment)
         
@@ -29,10 +32,9 @@ class BasicAuthBeforeStageHandler:
             self.unauthorized_message = environment.get("UNAUTHORIZED_MESSAGE", "Unauthorized")
             self.auth_realm = environment.get("AUTH_REALM", 'Basic realm="Access to Aquilify"')
 
-    @staticmethod
-    def _extract_credentials(auth_header: str):
-        auth_decoded = base64.b64decode(auth_header.split(' ')[1]).decode('utf-8')
-        return tuple(auth_decoded.split(':', 1)) if ':' in auth_decoded else ('', '')
+        self._expected_token = None
+        if self.username is not None and self.password is not None:
+            self._expected_token = base64.b64encode(f"{self.username}:{self.password}".encode('utf-8'))
 
     async def __call__(self, request: Request) -> Response:
         request.scope['user'] = None
@@ -43,8 +45,8 @@ class BasicAuthBeforeStageHandler:
                 if not auth_header or not auth_header.startswith('Basic '):
                     raise ValueError("Invalid Authorization Header")
 
-                provided_credentials = self._extract_credentials(auth_header)
-                if not provided_credentials or provided_credentials != (self.username, self.password):
+                token = auth_header[6:].strip().encode('utf-8')
+                if self._expected_token is None or not hmac.compare_digest(token, self._expected_token):
                     raise ValueError("Invalid Credentials")
 
                 request.scope['user'] = self.username
@@ -53,10 +55,7 @@ class BasicAuthBeforeStageHandler:
                 return self._unauthorized_response()
 
     def _should_apply_middleware(self, request: Request) -> bool:
-        route = request.url.path
-        if "*" in self.protected_routes or route in self.protected_routes:
-            return True
-        return False
+        return self._protect_all or request.url.path in self._protected_routes
 
     def _unauthorized_response(self):
         response = Response(self.unauthorized_message, status_code=401)
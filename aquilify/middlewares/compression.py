@@ -1,32 +1,87 @@
-from gzip import compress as gzip_compress, decompress as gzip_decompress
-from zlib import compress as deflate_compress, decompress as deflate_decompress
+from functools import partial
+from typing import Optional
+
+try:
+    from isal import isal_zlib as zlib_module
+    _MAX_DEFLATE_LEVEL = 3
+except ImportError:
+    import zlib as zlib_module
+    _MAX_DEFLATE_LEVEL = 9
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+from ..utils.concurrency import run_in_threadpool
+
+_INCOMPRESSIBLE_CONTENT_TYPES = (
+    b"image/",
+    b"video/",
+    b"audio/",
+    b"application/zip",
+    b"application/gzip",
+    b"application/x-gzip",
+)
+
+def _deflate_level(compress_level: int) -> int:
+    """Scale a zlib level (0-9) onto the range of the active deflate backend."""
+    return -(-compress_level * _MAX_DEFLATE_LEVEL // 9)
 
 class CompressionMiddleware:
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        offload_threshold: int = 64 * 1024,
+        compress_level: Optional[int] = None
+    ):
         self.app = app
+        self.minimum_size = minimum_size
+        self.offload_threshold = offload_threshold
+        if compress_level == -1:
+            compress_level = None
+        if compress_level is not None and not 0 <= compress_level <= 9:
+            raise ValueError(
+                f"compress_level must be -1 or between 0 and 9, got {compress_level!r}"
+            )
+        self.compress_level = compress_level
+        level = {} if compress_level is None else {'level': _deflate_level(compress_level)}
         self.compression_methods = {
             'gzip': {
-                'compress': gzip_compress,
-                'decompress': gzip_decompress
+                'compressobj': partial(zlib_module.compressobj, wbits=31, **level),
+                'decompressobj': partial(zlib_module.decompressobj, wbits=31)
             },
             'deflate': {
-                'compress': deflate_compress,
-                'decompress': deflate_decompress
+                'compressobj': partial(zlib_module.compressobj, wbits=15, **level),
+                'decompressobj': partial(zlib_module.decompressobj, wbits=15)
             }
         }
+        if zstd is not None:
+            zstd_level = 3 if compress_level is None else compress_level
+            self.compression_methods['zstd'] = {
+                'compressobj': lambda: zstd.ZstdCompressor(level=zstd_level).compressobj(),
+                'decompressobj': lambda: zstd.ZstdDecompressor().decompressobj()
+            }
+        self._supported_encodings = frozenset(self.compression_methods)
 
     async def __call__(self, scope, receive, send):
         if scope["type"] in ("http", "websocket"):
             headers = dict(scope["headers"])
-            supported_encodings = headers.get(b"accept-encoding", b"").split(b",")
-            supported_encodings = [encoding.strip() for encoding in supported_encodings]
+            accepted_encodings = [
+                encoding.strip() for encoding in
+                headers.get(b"accept-encoding", b"").decode("latin-1").split(",")
+            ]
 
-            for encoding in supported_encodings:
-                if encoding.decode() in self.compression_methods:
-                    scope["compression"] = encoding.decode()
-                    break
+            if "zstd" in self._supported_encodings and "zstd" in accepted_encodings:
+                scope["compression"] = "zstd"
             else:
-                scope["compression"] = None
+                for encoding in accepted_encodings:
+                    if encoding in self._supported_encodings:
+                        scope["compression"] = encoding
+                        break
+                else:
+                    scope["compression"] = None
 
         if scope["type"] == "http":
             await self._handle_http(scope, receive, send)
@@ -36,42 +91,75 @@ class CompressionMiddleware:
             await self.app(scope, receive, send)
 
     async def _handle_http(self, scope, receive, send):
-        if scope["method"] in ("PUT", "POST", "PATCH", "DELETE") and scope["compression"]:
-            body = await self._receive_body(scope, receive)
-            decompressed_body = self.compression_methods[scope["compression"]]['decompress'](body)
-            scope["body"] = decompressed_body
+        if scope["method"] in ("PUT", "POST", "PATCH", "DELETE"):
+            content_encoding = self._request_content_encoding(scope)
+            if content_encoding in self._supported_encodings:
+                receive = self._decompress_receive(receive, content_encoding)
 
         await self.app(scope, receive, await self._compress_send(send, scope["compression"]))
 
+    def _request_content_encoding(self, scope):
+        for key, value in scope["headers"]:
+            if key.lower() == b"content-encoding":
+                return value.decode("latin-1").strip().lower()
+        return None
+
+    def _decompress_receive(self, receive, compression_type):
+        decompressor = self.compression_methods[compression_type]['decompressobj']()
+
+        async def wrapper():
+            message = await receive()
+            if message.get("type") == "http.request":
+                body = decompressor.decompress(message.get("body", b""))
+                if not message.get("more_body", False):
+                    body += decompressor.flush()
+                message = {**message, "body": body}
+            return message
+        return wrapper
+
     async def _compress_send(self, send, compression_type):
+        compressor = None
+
         async def wrapper(message):
-            if message.get("type") == "http.response.start":
-                headers = [
-                    (key, value) for key, value in message.get("headers", [])
-                    if key.lower() not in (b"content-length", b"content-encoding")
-                ]
-                headers.append((b"content-encoding", compression_type.encode()))
-                await send({
-                    "type": "http.response.start",
-                    "headers": headers
-                })
-            elif message.get("type") == "http.response.body":
+            nonlocal compressor
+            message_type = message.get("type")
+            if message_type == "http.response.start":
+                if self._should_compress(compression_type, message.get("headers", [])):
+                    headers = [
+                        (key, value) for key, value in message.get("headers", [])
+                        if key.lower() not in (b"content-length", b"content-encoding")
+                    ]
+                    headers.append((b"content-encoding", compression_type.encode()))
+                    compressor = self.compression_methods[compression_type]['compressobj']()
+                    message = {**message, "headers": headers}
+                await send(message)
+            elif message_type == "http.response.body" and compressor is not None:
+                more_body = message.get("more_body", False)
                 body = message.get("body", b"")
-                compressed_body = self.compression_methods[compression_type]['compress'](body)
+                if len(body) > self.offload_threshold:
+                    compressed_body = await run_in_threadpool(compressor.compress, body)
+                else:
+                    compressed_body = compressor.compress(body)
+                if not more_body:
+                    compressed_body += compressor.flush()
                 await send({
                     "type": "http.response.body",
                     "body": compressed_body,
-                    "more_body": False
+                    "more_body": more_body
                 })
             else:
                 await send(message)
         return wrapper
 
-    async def _receive_body(self, scope, receive):
-        body = b""
-        more_body = True
-        while more_body:
-            message = await receive()
-            body += message.get("body", b"")
-            more_body = message.get("more_body", False)
-        return body
+    def _should_compress(self, compression_type, headers):
+        if not compression_type:
+            return False
+        for key, value in headers:
+            key = key.lower()
+            if key == b"content-encoding":
+                return False
+            if key == b"content-type" and value.lower().startswith(_INCOMPRESSIBLE_CONTENT_TYPES):
+                return False
+            if key == b"content-length" and value.isdigit() and int(value) < self.minimum_size:
+                return False
+        return True
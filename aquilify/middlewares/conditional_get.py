@@ -1,18 +1,30 @@
+from functools import lru_cache
+
 from aquilify.wrappers import Response, Request
-from aquilify.utils.cache import cc_delim_re, get_conditional_response, set_response_etag
+from aquilify.utils.cache import get_conditional_response, set_response_etag
 from aquilify.utils.http import parse_http_date_safe
 
+_parse_last_modified = lru_cache(maxsize=1024)(parse_http_date_safe)
+
+_CACHEABLE_STATUS_CODES = frozenset({200, 203, 204, 206, 300, 301, 404, 405, 410, 414, 501})
+
 class ConditionalGetMiddleware:
     def __init__(self) -> None:
         pass
     
     def needs_etag(self, response):
-        cache_control_headers = cc_delim_re.split(response.headers.get("Cache-Control", ""))
-        return all(header.lower() != "no-store" for header in cache_control_headers)
+        cache_control = response.headers.get("Cache-Control")
+        if not cache_control:
+            return True
+        return "no-store" not in cache_control.lower()
     
     async def __call__(self, request: Request, response: Response):
 
-        if request.method != "GET":
+        method = request.method
+        if method != "GET" and method != "HEAD":
+            return response
+
+        if response.status_code not in _CACHEABLE_STATUS_CODES:
             return response
 
         if self.needs_etag(response) and not response.headers.get("ETag"):
@@ -20,7 +32,7 @@ class ConditionalGetMiddleware:
 
         etag = response.headers.get("ETag")
         last_modified = response.headers.get("Last-Modified")
-        last_modified = last_modified and parse_http_date_safe(last_modified)
+        last_modified = last_modified and _parse_last_modified(last_modified)
 
         if etag or last_modified:
             return get_conditional_response(
@@ -1,9 +1,12 @@
+import inspect
 import logging
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 from ..wrappers import Request, Response
 from ..settings.cors import CORSConfigSettings
 
 _settings = CORSConfigSettings().fetch()
+_cors_logger = logging.getLogger("CORS")
 
 class CORS:
     """
@@ -84,13 +87,40 @@ class CORS:
         self.security_headers = _settings.get('security_headers') or {}
         self.log_cors_requests = _settings.get('log_request') or True
         self.preflight_response = _settings.get('preflight_response') or None
-        self.preflight_cache = _settings.get('preflight_cache') or {}
+        self.cache_preflight = _settings.get('preflight_cache', True)
+        self.preflight_cache = OrderedDict()
+        self.max_preflight_cache_size = 1024
         self.custom_response_handler = _settings.get('response_handler') or None
         self.origin_whitelist = _settings.get('origin_whitelist') or None
         self.automatic_preflight_handling = _settings.get('automatic_preflight_handling') or True
         self.dynamic_headers_whitelist = _settings.get('dynamic_headers_whitelist') or None
         self.exclude_paths = _settings.get('exclude_paths') or []
 
+        self._allow_origins_set = None if callable(self.allow_origins) else frozenset(self.allow_origins)
+        self._origins_wild = self._allow_origins_set is not None and "*" in self._allow_origins_set
+        # Any callable may hand back an awaitable (lambdas, partials, wrappers),
+        # so origin callbacks always go through the async path.
+        self._origin_check_is_async = self._allow_origins_set is None
+        self._allow_methods_set = frozenset(self.allow_methods)
+        self._methods_wild = "*" in self._allow_methods_set
+        self._allow_headers_set = None if callable(self.allow_headers) else frozenset(header.lower() for header in self.allow_headers)
+        self._headers_wild = self._allow_headers_set is not None and "*" in self._allow_headers_set
+        self._exclude_prefixes = tuple(path for path in self.exclude_paths if path != "/" and path.endswith("/"))
+        self._exclude_paths_set = frozenset(self.exclude_paths).difference(self._exclude_prefixes)
+        self._origin_encoded = {
+            origin: origin.encode() for origin in (self._allow_origins_set or ()) if isinstance(origin, str)
+        }
+        self._preflight_cacheable = bool(self.cache_preflight) and not (
+            self._allow_headers_set is None or self.dynamic_headers_whitelist
+        )
+
+        self._allow_credentials_b = b"true" if self.allow_credentials else b"false"
+        self._allow_headers_b = self.format_allowed_headers().encode()
+        self._allow_methods_b = ", ".join(self.allow_methods).encode()
+        self._expose_headers_b = ", ".join(self.expose_headers).encode() if self.expose_headers else None
+        self._security_headers_b = [(key.encode(), value.encode()) for key, value in self.security_headers.items()]
+        self._max_age_b = str(self.max_age).encode()
+
     async def __call__(self, request: Request, response: Response):
         """
         Middleware entry point to handle CORS.
@@ -104,14 +134,20 @@ class CORS:
         """
         origin = request.origin
 
-        if request.path in self.exclude_paths:
+        path = request.path
+        if path in self._exclude_paths_set or path.startswith(self._exclude_prefixes):
             return response
 
-        if await self.is_origin_allowed(origin):
+        if self._origin_check_is_async:
+            origin_allowed = await self.is_origin_allowed(origin)
+        else:
+            origin_allowed = self._is_origin_allowed_sync(origin)
+
+        if origin_allowed:
             if origin is not None:
-                response.headers[b"Access-Control-Allow-Origin"] = origin.encode()
+                response.headers[b"Access-Control-Allow-Origin"] = self._origin_encoded.get(origin) or origin.encode()
             else:
-                response.headers[b"Access-Control-Allow-Origin"] = '*'.encode()
+                response.headers[b"Access-Control-Allow-Origin"] = b"*"
         else:
             response.headers[b"Access-Control-Allow-Origin"] = b"null"
 
@@ -142,20 +178,50 @@ class CORS:
         requested_method = request.headers.get("access-control-request-method")
         requested_headers = request.headers.get("access-control-request-headers")
 
-        if self.is_method_allowed(requested_method) and self.is_headers_allowed(requested_headers):
+        key = (request.origin, requested_method, requested_headers)
+        if self._preflight_cacheable:
+            cached = self.preflight_cache.get(key)
+            if cached is not None:
+                self.preflight_cache.move_to_end(key)
+                response.status_code, content, headers = cached
+                if content is not None:
+                    response.content = content
+                response.headers.update(headers)
+                return None
+
+        parsed_headers = self._split_headers(requested_headers)
+        if self.is_method_allowed(requested_method) and self._is_headers_allowed(requested_headers, parsed_headers):
             if self.preflight_response:
                 preflight_resp = self.preflight_response(request)
                 if preflight_resp:
                     return preflight_resp
             response.status_code = 204
             response.content = b""
-            response.headers[b"Access-Control-Max-Age"] = str(self.max_age).encode()
+            response.headers[b"Access-Control-Max-Age"] = self._max_age_b
+            self._store_preflight(key, 204, b"", ((b"Access-Control-Max-Age", self._max_age_b),))
         else:
-            disallowed_headers = self.disallowed_headers(requested_headers)
+            disallowed_headers = self._disallowed_headers(parsed_headers)
             custom_resp = self.handle_custom_response(request, request.origin, disallowed_headers)
             if custom_resp:
                 return custom_resp
             response.status_code = 403
+            self._store_preflight(key, 403, None, ())
+
+    def _store_preflight(self, key, status_code: int, content: Optional[bytes], headers: tuple):
+        """
+        Stores the outcome of a preflight check in the LRU preflight cache.
+
+        Args:
+            key (tuple): The (origin, method, headers) preflight key.
+            status_code (int): The preflight status code.
+            content (Optional[bytes]): The preflight body, or None to leave it untouched.
+            headers (tuple): Header pairs set by the preflight check.
+        """
+        if not self._preflight_cacheable:
+            return
+        self.preflight_cache[key] = (status_code, content, headers)
+        if len(self.preflight_cache) > self.max_preflight_cache_size:
+            self.preflight_cache.popitem(last=False)
 
     def add_cors_headers(self, response: Response):
         """
@@ -164,15 +230,15 @@ class CORS:
         Args:
             response (Response): The HTTP response to modify.
         """
-        response.headers[b"Access-Control-Allow-Credentials"] = b"true" if self.allow_credentials else b"false"
-        response.headers[b"Access-Control-Allow-Headers"] = self.format_allowed_headers().encode()
-        response.headers[b"Access-Control-Allow-Methods"] = ", ".join(self.allow_methods).encode()
+        headers = response.headers
+        headers[b"Access-Control-Allow-Credentials"] = self._allow_credentials_b
+        headers[b"Access-Control-Allow-Headers"] = self._allow_headers_b
+        headers[b"Access-Control-Allow-Methods"] = self._allow_methods_b
 
-        if self.expose_headers:
-            response.headers[b"Access-Control-Expose-Headers"] = ", ".join(self.expose_headers).encode()
+        if self._expose_headers_b is not None:
+            headers[b"Access-Control-Expose-Headers"] = self._expose_headers_b
 
-        for key, value in self.security_headers.items():
-            response.headers[key.encode()] = value.encode()
+        headers.update(self._security_headers_b)
 
     def format_allowed_headers(self) -> str:
         """
@@ -195,13 +261,17 @@ class CORS:
         Returns:
             bool: True if the origin is allowed or if "*" is in self.allow_origins, False otherwise.
         """
-        if "*" in self.allow_origins:
+        if self._origin_check_is_async:
+            result = self.allow_origins(origin)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        return self._is_origin_allowed_sync(origin)
+
+    def _is_origin_allowed_sync(self, origin: str) -> bool:
+        if self._origins_wild:
             return True
-        if callable(self.allow_origins):
-            return await self.allow_origins(origin)
-        if isinstance(self.allow_origins, set):
-            return origin in self.allow_origins
-        return origin in self.allow_origins
+        return origin in self._allow_origins_set
 
     def is_method_allowed(self, method: str) -> bool:
         """
@@ -213,7 +283,7 @@ class CORS:
         Returns:
             bool: True if the method is allowed, False otherwise.
         """
-        return "*" in self.allow_methods or method in self.allow_methods
+        return self._methods_wild or method in self._allow_methods_set
 
     def is_headers_allowed(self, headers: Optional[str]) -> bool:
         """
@@ -225,16 +295,7 @@ class CORS:
         Returns:
             bool: True if the headers are allowed, False otherwise.
         """
-        if callable(self.allow_headers):
-            return self.allow_headers(headers)
-        if "*" in self.allow_headers:
-            return True
-        if headers is not None:
-            requested_headers = [header.strip() for header in headers.split(",")]
-            if self.dynamic_headers_whitelist:
-                return all(requested_header in self.dynamic_headers_whitelist(requested_headers) for requested_header in requested_headers)
-            return all(requested_header in self.allow_headers for requested_header in requested_headers)
-        return False
+        return self._is_headers_allowed(headers, self._split_headers(headers))
 
     def disallowed_headers(self, requested_headers: str) -> List[str]:
         """
@@ -246,14 +307,31 @@ class CORS:
         Returns:
             List[str]: List of headers that are not allowed.
         """
-        if callable(self.allow_headers):
-            return []
-        if "*" in self.allow_headers:
-            return []
+        return self._disallowed_headers(self._split_headers(requested_headers))
+
+    @staticmethod
+    def _split_headers(headers: Optional[str]) -> Optional[Tuple[str, ...]]:
+        if headers is None:
+            return None
+        return tuple(header.strip() for header in headers.split(","))
+
+    def _is_headers_allowed(self, headers: Optional[str], requested_headers: Optional[Tuple[str, ...]]) -> bool:
+        if self._allow_headers_set is None:
+            return self.allow_headers(headers)
+        if self._headers_wild:
+            return True
         if requested_headers is not None:
-            requested_headers = [header.strip() for header in requested_headers.split(",")]
-            return [header for header in requested_headers if header not in self.allow_headers]
-        return []
+            if self.dynamic_headers_whitelist:
+                whitelist = self.dynamic_headers_whitelist(list(requested_headers))
+                return all(requested_header in whitelist for requested_header in requested_headers)
+            return self._allow_headers_set.issuperset(header.lower() for header in requested_headers)
+        return False
+
+    def _disallowed_headers(self, requested_headers: Optional[Tuple[str, ...]]) -> List[str]:
+        if self._allow_headers_set is None or self._headers_wild or requested_headers is None:
+            return []
+        allowed = self._allow_headers_set
+        return [header for header in requested_headers if header.lower() not in allowed]
 
     def log_cors_request(self, request: Request, origin: str):
         """
@@ -263,8 +341,8 @@ class CORS:
             request (Request): The incoming HTTP request.
             origin (str): The origin of the request.
         """
-        logger = logging.getLogger("CORS")
-        logger.info(f"CORS Request: Origin - {origin}, Method - {request.method}, Path - {request.path}")
+        if _cors_logger.isEnabledFor(logging.INFO):
+            _cors_logger.info("CORS Request: Origin - %s, Method - %s, Path - %s", origin, request.method, request.path)
 
     def handle_custom_response(self, request: Request, origin: str, disallowed_headers: List[str]) -> Optional[Response]:
         """
@@ -1,17 +1,36 @@
+import asyncio
+import atexit
 import json
 import logging
 import secrets
 import hashlib
+import random
+from collections import deque
 from pathlib import Path
-from typing import Dict, Union, List, Optional
+from typing import Dict, Union, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..wrappers import Request, Response
 from ..exception.__handler import handle_exception
 from ..responses import HTMLResponse
 from ..settings.csp import CSPConfigSettings
+from ..utils.concurrency import run_in_threadpool
+from ._csp import build_static_headers
 
 _settings = CSPConfigSettings().fetch()
 
+_VIOLATION_BATCH_SIZE = 256
+_VIOLATION_FLUSH_INTERVAL = 0.05
+_MAX_VIOLATION_REPORTS = 10000
+_VIOLATION_QUEUE_SIZE = 10000
+_TOKEN_NONCE_ALGORITHMS = frozenset({'none', 'sha256'})
+_JSON_SEPARATORS = (',', ':')
+_INLINE_DIRECTIVES = frozenset({'script-src', 'style-src'})
+
 class CSPMiddleware:
     def __init__(
         self
@@ -25,10 +44,14 @@ class CSPMiddleware:
         self.log_file_path = Path(_settings.get('log_file_path')) or Path('csp_violation_reports.log')
         self.security_headers = _settings.get('security_headers') or {}
         self._setup_violation_log_file()
-        self.logger = self._setup_logging()
-        self.violation_reports = [],
+        self.logger = logging.getLogger('CSPViolationLogger')
+        self.violation_reports: deque = deque(maxlen=_settings.get('max_violation_reports') or _MAX_VIOLATION_REPORTS)
+        self.sampled_violation_reports: deque = deque(maxlen=self.violation_reports.maxlen)
         self.nonce_length: int = _settings.get('nonce_length') or 16
         self.nonce_algorithm: str = _settings.get('nonce_algorithm') or 'sha256'
+        self._hash_ctor = None
+        if self.nonce_algorithm not in _TOKEN_NONCE_ALGORITHMS:
+            self._hash_ctor = getattr(hashlib, self.nonce_algorithm, hashlib.sha256)
         self.referrer_policy: str = _settings.get("referrer_policy") or 'strict-origin-when-cross-origin'
         self.hsts_max_age: int = _settings.get('hsts_max_age') or 31536000
         self.hsts_include_subdomains: bool = _settings.get('hsts_include_subdomains') or True
@@ -44,89 +67,123 @@ class CSPMiddleware:
         self.referrer_policy_feature: bool = _settings.get('referrer_policy_feature') or False
         self.referrer_policy_no_referer: bool = _settings.get('referrer_policy_no_referer') or False
         self.referrer_policy_no_referrer_when_downgrade: bool = _settings.get('referrer_policy_no_referrer_when_downgrade') or False
+        self._static_headers = build_static_headers(
+            referrer_policy=self.referrer_policy,
+            hsts_max_age=self.hsts_max_age,
+            hsts_include_subdomains=self.hsts_include_subdomains,
+            hsts_preload=self.hsts_preload,
+            feature_policy=self.feature_policy,
+            x_content_type_options=self.x_content_type_options,
+            x_frame_options=self.x_frame_options,
+            x_xss_protection=self.x_xss_protection,
+            expect_ct=self.expect_ct,
+            cross_origin_opener_policy=self.cross_origin_opener_policy,
+            cross_origin_embedder_policy=self.cross_origin_embedder_policy,
+            referrer_policy_feature=self.referrer_policy_feature,
+            referrer_policy_no_referer=self.referrer_policy_no_referer,
+            referrer_policy_no_referrer_when_downgrade=self.referrer_policy_no_referrer_when_downgrade,
+        )
+        self._csp_header_name = 'Content-Security-Policy-Report-Only' if self.report_only else 'Content-Security-Policy'
+        self._csp_header_value: Optional[str] = None
+        self._csp_report_only_value: Optional[str] = None
+        self._csp_template: Tuple[Optional[str], ...] = ()
+        self._needs_nonce = self._uses_nonce()
+        if self._needs_nonce:
+            self._csp_template = self._build_csp_template()
+        else:
+            self._csp_header_value = self._generate_csp_header()
+            if self.report_uri:
+                self._csp_report_only_value = f"{self._csp_header_value}; report-uri {self.report_uri}"
+        self._response_headers = self._build_response_headers()
+
+    def _build_response_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self._csp_header_value is not None:
+            headers[self._csp_header_name] = self._csp_header_value
+            if self._csp_report_only_value is not None:
+                headers['Content-Security-Policy-Report-Only'] = self._csp_report_only_value
+        headers.update(self.security_headers)
+        headers.update(self._static_headers)
+        return headers
 
     async def __call__(self, request: Request, response: Response) -> Response:
         try:
-            if self.force_https and request.scheme != "https":
-                    response = HTMLResponse('<h1>Bad Request | HTTPS Connection Required | 400</h1>', status=400)
-                    return response
-            
-            if self._is_violation_report_request(request):
+            if request.scope['path'] == self.violation_report_endpoint and request.method == 'POST':
                 await self._handle_violation_reports(request)
                 return Response(content='Violation report received and logged.', status_code=200)
-            response = self._set_csp_header(response)
-            response = self._set_additional_security_headers(response)
-
-            if self.expect_ct:
-                response['headers']["Expect-CT"] = self.expect_ct
-
-            if self.cross_origin_opener_policy:
-                response['headers']["Cross-Origin-Opener-Policy"] = self.cross_origin_opener_policy
-
-            if self.cross_origin_embedder_policy:
-                response['headers']["Cross-Origin-Embedder-Policy"] = self.cross_origin_embedder_policy
-
-            response.headers["Referrer-Policy"] = self.referrer_policy
-
-            if self.referrer_policy_feature:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "features"
-
-            if self.referrer_policy_no_referer:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "no-referer"
 
-            if self.referrer_policy_no_referrer_when_downgrade:
-                response.headers["Referrer-Policy"] = self.referrer_policy + ", " + "no-referrer-when-downgrade"
-                
-            hsts_directive = f"max-age={self.hsts_max_age}"
-            if self.hsts_include_subdomains:
-                hsts_directive += "; includeSubDomains"
-            if self.hsts_preload:
-                hsts_directive += "; preload"
-            response.headers["Strict-Transport-Security"] = hsts_directive
-
-            if self.feature_policy:
-                feature_policy_directives = " ".join([f"{key} {value}" for key, value in self.feature_policy.items()])
-                response.headers["Feature-Policy"] = feature_policy_directives
+            if self.force_https and request.scheme != "https":
+                return HTMLResponse('<h1>Bad Request | HTTPS Connection Required | 400</h1>', status=400)
 
-            response.headers["X-Content-Type-Options"] = self.x_content_type_options
-            response.headers["X-Frame-Options"] = self.x_frame_options
-            response.headers["X-XSS-Protection"] = self.x_xss_protection
+            if self._csp_header_value is None:
+                response = self._set_csp_header(response)
+            response.headers.update(self._response_headers)
             return response
         except Exception as e:
             await handle_exception(e)
         return response
 
-    def _is_violation_report_request(self, request: Request) -> bool:
-        return request.scope['path'] == self.violation_report_endpoint and request.method == 'POST'
-
     def _set_csp_header(self, response: Response) -> Response:
-        csp_header_value = self._generate_csp_header()
-        response.headers['Content-Security-Policy' if not self.report_only else 'Content-Security-Policy-Report-Only'] = csp_header_value
+        csp_header_value = self._render_csp_template()
+        response.headers[self._csp_header_name] = csp_header_value
         if self.report_uri:
             response.headers['Content-Security-Policy-Report-Only'] = f"{csp_header_value}; report-uri {self.report_uri}"
         return response
 
+    def _build_csp_template(self) -> Tuple[Optional[str], ...]:
+        parts: List[Optional[str]] = []
+        for directive, value in self.csp_directives.items():
+            if parts:
+                parts.append("; ")
+            parts.append(f"{directive} ")
+            values = value if isinstance(value, list) else [value]
+            inline = self._is_inline_directive(directive)
+            for index, item in enumerate(values):
+                if index:
+                    parts.append(" ")
+                parts.append(None if inline and "'nonce'" in item else item)
+
+        template: List[Optional[str]] = []
+        for part in parts:
+            if part is not None and template and template[-1] is not None:
+                template[-1] += part
+            else:
+                template.append(part)
+        return tuple(template)
+
+    def _render_csp_template(self) -> str:
+        generate_nonce = self._generate_nonce
+        return "".join([generate_nonce() if part is None else part for part in self._csp_template])
+
+    def _uses_nonce(self) -> bool:
+        for directive, value in self.csp_directives.items():
+            if self._is_inline_directive(directive):
+                values = value if isinstance(value, list) else [value]
+                if any("'nonce'" in item for item in values):
+                    return True
+        return False
+
     def _generate_csp_header(self) -> str:
         csp_directive_strings = [f"{directive} {self._generate_directive_value(directive)}" for directive in self.csp_directives.keys()]
         return "; ".join(csp_directive_strings)
 
     def _generate_directive_value(self, directive: str) -> str:
         value = self.csp_directives[directive]
+        if not self._needs_nonce:
+            return self._join_values(value)
         return self._join_values(self._generate_nonce_for_inline(value) if self._is_inline_directive(directive) else value)
 
     def _generate_nonce_for_inline(self, directives: Union[str, List[str]]) -> Union[str, List[str]]:
         return [self._generate_nonce() if "'nonce'" in directive else directive for directive in directives] if isinstance(directives, list) else self._generate_nonce() if "'nonce'" in directives else directives
 
     def _generate_nonce(self) -> str:
-        nonce = secrets.token_urlsafe(self.nonce_length)
-        if self.nonce_algorithm:
-            hash_func = getattr(hashlib, self.nonce_algorithm, hashlib.sha256)
-            hashed_nonce = hash_func(nonce.encode()).digest()
-            return hashed_nonce.hex()
-        return nonce
+        hash_ctor = self._hash_ctor
+        if hash_ctor is None:
+            return secrets.token_hex(self.nonce_length)
+        return hash_ctor(secrets.token_bytes(self.nonce_length)).hexdigest()
 
     def _is_inline_directive(self, directive: str) -> bool:
-        return directive in ['script-src', 'style-src']
+        return directive in _INLINE_DIRECTIVES
 
     def _join_values(self, value: Union[str, List[str]]) -> str:
         return " ".join(value) if isinstance(value, list) else value
@@ -134,35 +191,51 @@ class CSPMiddleware:
     def _setup_violation_log_file(self) -> None:
         if not self.log_file_path.is_file():
             self.log_file_path.touch()
-
-    def _setup_logging(self) -> logging.Logger:
-        logger = logging.getLogger('CSPViolationLogger')
-        logger.setLevel(logging.INFO)
-        handler = logging.FileHandler(self.log_file_path)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        return logger
+        self._violation_log = self.log_file_path.open(mode='ab', buffering=1 << 20)
+        atexit.register(self._violation_log.close)
+        self._violation_queue: Optional[asyncio.Queue] = None
+        self._violation_writer: Optional[asyncio.Task] = None
 
     async def _handle_violation_reports(self, request: Request) -> None:
-        violation_report = await request.json()
-        self._store_violation_report(violation_report)
-        self.logger.info(json.dumps(violation_report))
+        body = await request.body()
+        if orjson is not None:
+            violation_report = orjson.loads(body)
+            serialized_report = orjson.dumps(violation_report)
+        else:
+            violation_report = json.loads(body)
+            serialized_report = json.dumps(violation_report, separators=_JSON_SEPARATORS).encode()
+        self._store_violation_report(serialized_report)
         self.violation_reports.append(violation_report)
         if self.enable_violation_handling:
-            self._process_violation_reports()
-
-    def _store_violation_report(self, violation_report: dict) -> None:
-        with self.log_file_path.open(mode='a') as file:
-            file.write(json.dumps(violation_report) + '\n')
+            self._process_violation_reports(violation_report)
 
-    def _process_violation_reports(self) -> None:
-        num_reports = len(self.violation_reports)
-        if num_reports > 0:
-            weighted_reports = int(self.report_sample_weight * num_reports)
-            reports_to_process = self.violation_reports[:weighted_reports]
+    def _store_violation_report(self, serialized_report: bytes) -> None:
+        if self._violation_queue is None:
+            self._violation_queue = asyncio.Queue(maxsize=_VIOLATION_QUEUE_SIZE)
+            self._violation_writer = asyncio.get_running_loop().create_task(self._write_violation_reports())
+        try:
+            self._violation_queue.put_nowait(serialized_report + b'\n')
+        except asyncio.QueueFull:
+            # The writer is behind; drop the report rather than grow without bound.
+            pass
+
+    async def _write_violation_reports(self) -> None:
+        queue = self._violation_queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(_VIOLATION_FLUSH_INTERVAL)
+            while len(batch) < _VIOLATION_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await run_in_threadpool(self._write_violation_batch, b"".join(batch))
+            except Exception as e:
+                self.logger.error("Error writing CSP violation reports: %s", e)
+
+    def _write_violation_batch(self, payload: bytes) -> None:
+        self._violation_log.write(payload)
+        self._violation_log.flush()
+
+    def _process_violation_reports(self, violation_report: dict) -> None:
+        if random.random() < self.report_sample_weight:
+            self.sampled_violation_reports.append(violation_report)
 
-    def _set_additional_security_headers(self, response: Response) -> Response:
-        for header, value in self.security_headers.items():
-            response.headers[header] = value
-        return response
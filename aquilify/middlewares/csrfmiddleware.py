@@ -1,6 +1,10 @@
 from typing import Any, Awaitable, Callable
 from aquilify.wrappers import Request, Response
 
+_CSRF_TOKEN_KEY = '_csrf_token'
+_CSRF_VIEW_KEY = '_csrf_view'
+_MISSING = object()
+
 class CSRFConfigurationError(Exception):
     pass
 
@@ -13,25 +17,17 @@ class CSRFMiddleware:
         request: Request,
         response: Response
     ) -> Response:
-        csrf_token_key = '_csrf_token'
-        csrf_view_key = '_csrf_view'
+        if request.method != 'GET':
+            return response
 
-        if request.method in ['GET']:
-            if csrf_token_key not in request.context:
-                return response
-            
-            if csrf_view_key not in request.context:
-                return response
-            
-            csrf_token = request.context.get(csrf_token_key)
-            csrf_view = request.context.get(csrf_view_key)
+        context = request.context
+        csrf_token = context.get(_CSRF_TOKEN_KEY, _MISSING)
+        csrf_view = context.get(_CSRF_VIEW_KEY, _MISSING)
+        if csrf_token is _MISSING or csrf_view is _MISSING:
+            return response
 
-            try:
-                await self._inject_csrf_token(csrf_view, response, csrf_token)
-                response.headers['X-CSRF-TOKEN'] = csrf_token
-                return response
-            except CSRFConfigurationError as e:
-                raise e
+        await self._inject_csrf_token(csrf_view, response, csrf_token)
+        response.headers['X-CSRF-TOKEN'] = csrf_token
         return response
 
     async def _inject_csrf_token(
@@ -1,5 +1,5 @@
 import logging
-from typing import Awaitable, Callable, Dict, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
 from ..types import ASGIApp, Receive, Scope, Send
 from ..responses import JsonResponse
 
@@ -80,6 +80,47 @@ class Dispatcher:
             mount_point: None for mount_point in mounts
         }
         self.logger = logging.getLogger(__name__)
+        self._mount_trie: Dict[Any, Any] = {}
+        self._mount_prefixes: Tuple[str, ...] = ()
+        self._rebuild_mount_trie()
+
+    def _rebuild_mount_trie(self) -> None:
+        """
+        Rebuilds the path-segment trie used to find the mounted app for a path.
+
+        Each node maps a path segment to its child node, and the ``None`` key of
+        a node holds the ``(mount_point, app)`` pair mounted at that depth.
+        """
+        trie: Dict[Any, Any] = {}
+        for mount_point, app in self.mounts.items():
+            node = trie
+            for segment in mount_point.split('/'):
+                node = node.setdefault(segment, {})
+            node[None] = (mount_point, app)
+        self._mount_trie = trie
+        self._mount_prefixes = tuple(self.mounts)
+
+    def _match_mount(self, path: str) -> Optional[Tuple[str, ASGIApp]]:
+        """
+        Finds the longest mount point that ``path`` equals or lies under.
+
+        Args:
+            path (str): The request path.
+
+        Returns:
+            Optional[Tuple[str, ASGIApp]]: The matched mount point and app, or None.
+        """
+        if not path.startswith(self._mount_prefixes):
+            return None
+
+        match = None
+        node = self._mount_trie
+        for segment in path.split('/'):
+            node = node.get(segment)
+            if node is None:
+                break
+            match = node.get(None, match)
+        return match
 
     def map_url(self, mount_point: str, app: ASGIApp, 
                 error_handler: Optional[Callable[..., Awaitable[None]]] = None) -> None:
@@ -93,6 +134,7 @@ class Dispatcher:
         """
         self.mounts[mount_point] = app
         self.error_handlers[mount_point] = error_handler
+        self._rebuild_mount_trie()
 
     def unmap_url(self, mount_point: str) -> None:
         """
@@ -104,6 +146,7 @@ class Dispatcher:
         if mount_point in self.mounts:
             del self.mounts[mount_point]
             del self.error_handlers[mount_point]
+            self._rebuild_mount_trie()
 
     async def conditional_mount(self, mount_point: str, app: ASGIApp,
                                condition: Union[Callable, Awaitable[bool]], 
@@ -122,6 +165,7 @@ class Dispatcher:
         if condition:
             self.mounts[mount_point] = app
             self.error_handlers[mount_point] = error_handler
+            self._rebuild_mount_trie()
 
     async def dispatch(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
@@ -133,21 +177,22 @@ class Dispatcher:
             send (Send): Callable to send messages to the client.
         """
         path = scope.get('path', '/')
-        for mount_point, mounted_app in self.mounts.items():
-            if path == mount_point or path.startswith(mount_point + '/'):
-                sub_path = path[len(mount_point):] if path != mount_point else '/'
-                scope['path'] = sub_path
-                scope['app_mount'] = mount_point
-                error_handler = self.error_handlers.get(mount_point)
-                try:
-                    await mounted_app(scope, receive, send)
-                except Exception as e:
-                    if error_handler:
-                        await error_handler(scope, receive, send, e)
-                    else:
-                        self.logger.exception(f"An error occurred in the mounted app {mount_point}.")
-                        await self.general_error_handler(scope, receive, send, e)
-                return
+        match = self._match_mount(path)
+        if match is not None:
+            mount_point, mounted_app = match
+            sub_path = path[len(mount_point):] if path != mount_point else '/'
+            scope['path'] = sub_path
+            scope['app_mount'] = mount_point
+            error_handler = self.error_handlers.get(mount_point)
+            try:
+                await mounted_app(scope, receive, send)
+            except Exception as e:
+                if error_handler:
+                    await error_handler(scope, receive, send, e)
+                else:
+                    self.logger.exception(f"An error occurred in the mounted app {mount_point}.")
+                    await self.general_error_handler(scope, receive, send, e)
+            return
         await self.main_app(scope, receive, send)
 
     async def general_error_handler(self, scope: Scope, receive: Receive, send: Send, exc: Exception) -> None:
@@ -1,17 +1,50 @@
-import os
-import gzip
+import hashlib
 import json
 import logging
-import uuid
+import zlib
+
+from collections import OrderedDict
+from functools import lru_cache
 
-from io import BytesIO
 from ..settings.compression import CompressionSetting
+from ..utils.concurrency import run_in_threadpool
+
+COMPRESSION_TIERS = {
+    'realtime': 1,
+    'balanced': 3,
+    'archival': 9,
+}
+
+@lru_cache(maxsize=None)
+def _get_logger():
+    logger = logging.getLogger('GzipMiddleware')
+    logger.setLevel(logging.DEBUG)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
+    ch.setFormatter(formatter)
+
+    logger.addHandler(ch)
+    return logger
+
+@lru_cache(maxsize=None)
+def _load_settings():
+    return CompressionSetting._compression_settings()
+
+def _gzip_compress(content, compress_level):
+    # zlib.compress() only accepts wbits on Python 3.11+, so build the
+    # gzip stream with a compressobj to keep older interpreters working.
+    compressor = zlib.compressobj(compress_level, zlib.DEFLATED, 31)
+    return compressor.compress(content) + compressor.flush()
 
 class GzipMiddleware:
     def __init__(
         self
     ):
-        self.compress_level = 6
+        self.compress_level = COMPRESSION_TIERS['balanced']
+        self.minimum_size = 1024
+        self.offload_threshold = 64 * 1024
         self.content_types = [
             'text/html',
             'text/css',
@@ -22,102 +55,120 @@ class GzipMiddleware:
         self.exclude_paths = []
         self.encodings = ['gzip']
         self.custom_compress_funcs = {}
-        self.compression_folder = '.aquilify/compression/'
-        self.config_file = '.aquilify/config.json'
-        self.logger = self._setup_logger()
-        self._create_aquilify_folder()
-        self._create_compression_folder()
-
-        self.settings = CompressionSetting._compression_settings()
-        self.compress_level = self.settings['GZIP_COMPRESSION_LEVEL']
+        self.max_cache_bytes = 4 * 1024 * 1024
+        self.max_cacheable_size = 256 * 1024
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+        self.logger = _get_logger()
+
+        self.settings = _load_settings()
+        if 'GZIP_COMPRESSION_LEVEL' in self.settings:
+            self.compress_level = self.settings['GZIP_COMPRESSION_LEVEL']
+        elif 'GZIP_COMPRESSION_TIER' in self.settings:
+            tier = self.settings['GZIP_COMPRESSION_TIER']
+            if tier not in COMPRESSION_TIERS:
+                raise ValueError(
+                    f"Invalid GZIP_COMPRESSION_TIER {tier!r}; expected one of: {', '.join(COMPRESSION_TIERS)}"
+                )
+            self.compress_level = COMPRESSION_TIERS[tier]
         self.content_types = self.settings['GZIP_COMPRESSION_CONTENT_TYPES']
         self.ignore_content_length = self.settings['GZIP_IGNORE_CONTENT_LENGHT']
         self.exclude_paths = self.settings['GZIP_EXCLUDE_PATHS']
         self.encodings = self.settings['GZIP_CONTENT_ENCODING']
         self.custom_compress_funcs = self.settings['GZIP_COMPRESSION_FUNCTION']
-
-    def _setup_logger(self):
-        logger = logging.getLogger('GzipMiddleware')
-        logger.setLevel(logging.DEBUG)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.DEBUG)
-        ch.setFormatter(formatter)
-
-        logger.addHandler(ch)
-        return logger
-
-    def _create_aquilify_folder(self):
-        try:
-            aquilify_folder = os.path.join(os.getcwd(), '.aquilify')
-            if not os.path.exists(aquilify_folder):
-                os.makedirs(aquilify_folder)
-        except Exception as e:
-            self.logger.error(f"Error creating '.aquilify' folder: {e}")
-
-    def _create_compression_folder(self):
-        try:
-            compression_folder_path = os.path.join(os.getcwd(), self.compression_folder)
-            if not os.path.exists(compression_folder_path):
-                os.makedirs(compression_folder_path)
-        except Exception as e:
-            self.logger.error(f"Error creating '{self.compression_folder}' folder: {e}")
+        self._exclude_paths = tuple(self.exclude_paths)
+        self._content_types = tuple(self.content_types)
+        self._encodings = frozenset(encoding.strip() for encoding in self.encodings)
 
     async def __call__(self, request, response):
         try:
-            if len(response.content) <= 50:
+            if 'gzip' not in request.headers.get('accept-encoding', ''):
+                return response
+
+            streaming = getattr(response, 'streaming', False)
+            if not streaming and len(response.content) < self.minimum_size:
                 return response
             
             if self._should_exclude_path(request.scope['path']):
                 return response
 
             should_compress, content_type = self._should_compress(response)
-            if should_compress:
+            if not should_compress:
+                return response
+
+            if streaming:
+                response.content = self._compress_stream(response.content)
+                response.headers.pop('Content-Length', None)
+                response.headers.update({
+                    'Content-Encoding': 'gzip',
+                    'Vary': 'Accept-Encoding',
+                    'Transfer-Encoding': 'chunked'
+                })
                 return response
 
             compressed_content = await self._compress_content(response.content, content_type)
             response.content = compressed_content
             response.headers.update(self._create_gzip_headers(compressed_content, content_type))
 
-            self._save_compressed_data(compressed_content)
-            self._update_config_file()
-            self._cleanup_old_files()
-
         except Exception as e:
             self.logger.error(f"Error compressing response content: {e}")
 
         return response
     
     def _should_exclude_path(self, path):
-        return any(path.startswith(excluded_path) for excluded_path in self.exclude_paths)
+        return path.startswith(self._exclude_paths)
 
     def _should_compress(self, response):
-        content_type = response.headers.get('Content-Type', '')
-        encoding = response.headers.get('Content-Encoding', '')
-        
-        should_compress = (
-            'Content-Encoding' not in response.headers and
-            response.content and
-            any(content_type.startswith(ct) for ct in self.content_types) and
-            any(enc in self.encodings for enc in encoding.split(','))
-        )
-        return should_compress, content_type
+        headers = response.headers
+        content_type = headers.get('Content-Type') or getattr(response, 'content_type', '')
+        if 'Content-Encoding' in headers or not response.content or 'gzip' not in self._encodings:
+            return False, content_type
+        return content_type.startswith(self._content_types), content_type
 
     async def _compress_content(self, content, content_type):
         if content_type in self.custom_compress_funcs:
             return await self.custom_compress_funcs[content_type](content)
 
-        if isinstance(content, (str, dict, list, tuple)):
-            content = str(content).encode()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        elif isinstance(content, (dict, list, tuple)):
+            content = json.dumps(content).encode('utf-8')
         elif not isinstance(content, bytes):
             raise ValueError("Unsupported response content type for compression")
 
-        buffer = BytesIO()
-        with gzip.GzipFile(fileobj=buffer, mode='w', compresslevel=self.compress_level) as gz:
-            gz.write(content)
-
-        return buffer.getvalue()
+        cacheable = len(content) <= self.max_cacheable_size
+        if cacheable:
+            key = hashlib.blake2b(content, digest_size=16).digest()
+            compressed = self._cache.get(key)
+            if compressed is not None:
+                self._cache.move_to_end(key)
+                return compressed
+
+        if len(content) > self.offload_threshold:
+            compressed = await run_in_threadpool(_gzip_compress, content, self.compress_level)
+        else:
+            compressed = _gzip_compress(content, self.compress_level)
+        if cacheable:
+            self._cache[key] = compressed
+            self._cache_bytes += len(compressed)
+            while self._cache_bytes > self.max_cache_bytes:
+                self._cache_bytes -= len(self._cache.popitem(last=False)[1])
+        return compressed
+
+    def _compress_stream(self, content):
+        compress_level = self.compress_level
+
+        async def stream(scope, receive, send):
+            compressor = zlib.compressobj(compress_level, zlib.DEFLATED, 31)
+            async for chunk in content(scope, receive, send):
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                data = compressor.compress(chunk)
+                if data:
+                    yield data
+            yield compressor.flush()
+
+        return stream
 
     def _create_gzip_headers(self, compressed_content, content_type):
         headers = {
@@ -131,48 +182,3 @@ class GzipMiddleware:
             headers['Content-Type'] = content_type
 
         return headers
-
-    def _save_compressed_data(self, compressed_content):
-        try:
-            filename = self._generate_unique_filename()
-            file_path = os.path.join(os.getcwd(), self.compression_folder, filename)
-            with open(file_path, 'wb') as file:
-                file.write(compressed_content)
-        except Exception as e:
-            self.logger.error(f"Error saving compressed data: {e}")
-
-    def _generate_unique_filename(self):
-        return str(uuid.uuid4()) + '.gzip'
-
-    def _update_config_file(self):
-        try:
-            config_path = os.path.join(os.getcwd(), self.config_file)
-            if not os.path.exists(config_path):
-                config_data = {"$compression": []}
-            else:
-                with open(config_path, 'r') as file:
-                    config_data = json.load(file)
-
-            filename = self._generate_unique_filename()
-            config_data["$compression"].append(filename)
-
-            with open(config_path, 'w') as file:
-                json.dump(config_data, file, indent=4)
-        except Exception as e:
-            self.logger.error(f"Error updating config file: {e}")
-
-    def _cleanup_old_files(self):
-        try:
-            compression_folder_path = os.path.join(os.getcwd(), self.compression_folder)
-            files_in_compression_folder = os.listdir(compression_folder_path)
-
-            if len(files_in_compression_folder) > 10: 
-                oldest_files = sorted(files_in_compression_folder, key=lambda x: os.path.getmtime(os.path.join(compression_folder_path, x)))
-                for file in oldest_files[:-10]: 
-                    file_path = os.path.join(compression_folder_path, file)
-                    if os.path.exists(file_path):
-                        os.remove(file_path)
-                    else:
-                        self.logger.warning(f"File {file_path} does not exist.")
-        except Exception as e:
-            self.logger.error(f"Error cleaning up old files: {e}")
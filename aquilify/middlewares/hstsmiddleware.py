@@ -22,7 +22,8 @@ class HSTSMiddleware:
         include_subdomains: bool = getattr(settings, 'HSTS_INCLUDE_SUBDOMAINS', True),
     ) -> None:
         self._value = write_hsts_header_value(max_age, include_subdomains)
+        self._value_bytes = self._value.encode('ascii')
 
     async def __call__(self, request: Request, response: Response):
-        response.headers["Strict-Transport-Security"] = self._value
+        response.headers["Strict-Transport-Security"] = self._value_bytes
         return response
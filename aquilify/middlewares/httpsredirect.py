@@ -10,6 +10,7 @@ class HTTPSRedirectMiddleware:
     def __init__(self) -> None:
         self.strict = _settings.get('strict') or True
         self.allowed_hosts = _settings.get('allowed_host') or []
+        self._allowed_hosts = frozenset(self.allowed_hosts)
 
     async def __call__(self, request: Request, response: Response) -> Response:
         if self._should_redirect(request):
@@ -18,13 +19,21 @@ class HTTPSRedirectMiddleware:
         return response
 
     def _should_redirect(self, request: Request) -> bool:
-        if self.strict:
-            return request.scheme == 'http' and self._is_allowed_host(request)
-        else:
-            return not request.scheme == 'https' and self._is_allowed_host(request)
+        scheme = request.scheme
+        if (scheme != 'http') if self.strict else (scheme == 'https'):
+            return False
+        return self._is_allowed_host(request)
 
     def _is_allowed_host(self, request: Request) -> bool:
-        return not self.allowed_hosts or request.client.host in self.allowed_hosts
+        return not self._allowed_hosts or request.scope['client'][0] in self._allowed_hosts
 
     def _construct_https_url(self, request: Request) -> str:
-        return request.url.replace(scheme='https')
\ No newline at end of file
+        host = request.host
+        if host is None:
+            return request.url.replace(scheme='https')
+        scope = request.scope
+        url = 'https://' + host + scope.get('root_path', '') + scope['path']
+        query_string = scope.get('query_string')
+        if query_string:
+            url += '?' + query_string.decode()
+        return url
\ No newline at end of file
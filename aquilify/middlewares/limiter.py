@@ -1,11 +1,37 @@
+import logging
+import os
 import time
+from itertools import chain, count
+from collections import OrderedDict
 from typing import Callable, Awaitable, Dict, List, Optional, Tuple
 from ..wrappers import Request, Response
 from ..settings.ratelimit import RateLimitConfigSettings
 from ..exception.base import TooManyRequests
+from ..utils._utils import is_async_callable
+from ..utils.network import IPSet
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+except ImportError:
+    aioredis = None
+    RedisError = None
+
+logger = logging.getLogger(__name__)
 
 _settings = RateLimitConfigSettings().fetch()
 
+_SLIDING_WINDOW_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, tonumber(ARGV[1]) - tonumber(ARGV[2]))
+local count = redis.call('ZCARD', KEYS[1])
+if count < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return {1, count + 1}
+end
+return {0, count}
+"""
+
 class RateLimiter:
     def __init__(
         self
@@ -20,48 +46,86 @@ class RateLimiter:
         self.monitoring_callback: Optional[Callable[[str, int, int, int], Awaitable[None]]] = _settings.get('monitoring_callback') or None
         self.whitelist: List[str] = _settings.get('whitelist') or []
         self.blacklist: List[str] = _settings.get('blacklist') or []
-        self.requests: Dict[str, List[float]] = {}
+        self._exempt_paths = frozenset(self.exempt_paths)
+        self._whitelist = IPSet(self.whitelist)
+        self._blacklist = IPSet(self.blacklist)
+        self.buckets: Dict[str, Dict[int, List[int]]] = {}
         self.concurrent_requests: Dict[str, int] = {}
         self.rate_limit_by_endpoint: Dict[str, Tuple[int, int]] = _settings.get('endpoint') or {}
         self.rate_limit_adjustments: Dict[str, Callable[[int, int], Tuple[int, int]]] = _settings.get('adjustments') or {}
         self.rate_limit_expiry_policies: Dict[str, Callable[[int, int], int]] = _settings.get('expiry_policies') or {}
         self.ip_rate_limits: Dict[str, Tuple[int, int]] = _settings.get('ip_rate_limits') or {}
         self.rate_limit_bypass_tokens: Dict[str, List[str]] = _settings.get('bypass_token') or {}
+        self._bypass_tokens = frozenset(chain.from_iterable(self.rate_limit_bypass_tokens.values()))
         self.advanced_monitoring_report: Optional[Callable[[str, int, int, int], Awaitable[None]]] = _settings.get('advance_monitoring_and_reporting') or None
         self.granular_rate_limits: Dict[str, Tuple[int, int]] = _settings.get('granular') or {}
         self.automated_rate_limit_adjustment: Optional[Callable[[str, int, int], Awaitable[Tuple[int, int]]]] = _settings.get('automated_adjustments') or None
         self.granular_rate_limit_callback: Optional[Callable[[str, str], Awaitable[Tuple[int, int]]]] = _settings.get('granular_callback') or None
-        self.cache_size = 1000 
-        self.rate_limit_cache = {}
+        self._adjustment_is_async = is_async_callable(self.automated_rate_limit_adjustment)
+        self.cache_size = 1000
+        self.cache_ttl = 5
+        self.rate_limit_cache: OrderedDict = OrderedDict()
         self.rate_limits = {}
+        self.sweep_interval = 1000
+        self._requests_since_sweep = 0
+        self.redis_url: Optional[str] = _settings.get('redis_url') or None
+        self._redis = None
+        if self.redis_url:
+            if aioredis is None:
+                raise ImportError("RATE_LIMITER_REDIS_URL requires the 'redis' package to be installed")
+            self._redis = aioredis.Redis.from_url(self.redis_url)
+            self._sliding_window = self._redis.register_script(_SLIDING_WINDOW_SCRIPT)
+            self._member_ids = count()
 
     async def __call__(self, request: Request, response: Response) -> Response:
         client_ip: str = request.remote_addr
-        current_time: float = time.time()
+        current_time: int = time.monotonic_ns()
         endpoint: str = request.path
 
-        if self.is_exempt_path(endpoint) or self.is_whitelisted(client_ip) or await self.is_bypass_token(request) or client_ip in self.blacklist:
+        if endpoint in self._exempt_paths or client_ip in self._whitelist or client_ip in self._blacklist or await self.is_bypass_token(request):
             return response
 
-        limit, window = self.get_rate_limit(client_ip, endpoint)
+        limit, window = await self.get_rate_limit(client_ip, endpoint, current_time)
         limit, window = self.apply_rate_limit_adjustments(client_ip, endpoint, limit, window)
 
+        self._requests_since_sweep += 1
+        if self._requests_since_sweep >= self.sweep_interval:
+            self.sweep(current_time)
+
         if self.is_concurrency_control_enabled(client_ip) and self.is_concurrency_exceeded(client_ip):
             return TooManyRequests('Concurrency limit exceeded')
 
-        if not self.track_request(client_ip, current_time, window, limit):
-            error_response = self.create_rate_limit_exceeded_response(client_ip, limit, window, current_time)
+        request_count: Optional[int] = None
+        if self._redis is not None:
+            try:
+                allowed, request_count = await self.track_request_redis(client_ip, window, limit)
+            except RedisError as e:
+                # Keep limiting with the in-process buckets while Redis is unreachable.
+                logger.warning("Redis rate limiting failed, using in-process limits: %s", e)
+                allowed = self.track_request(client_ip, current_time, window, limit)
+        else:
+            allowed = self.track_request(client_ip, current_time, window, limit)
+
+        if not allowed:
+            error_response = self.create_rate_limit_exceeded_response(client_ip, limit, window, time.time(), request_count)
             return error_response
 
-        if self.is_rate_limit_expired(client_ip, current_time, window):
+        if self.rate_limit_expiry and self.is_rate_limit_expired(client_ip, time.time(), window):
             self.clear_rate_limit(client_ip)
+            if self._redis is not None:
+                await self.clear_rate_limit_redis(client_ip, window)
 
-        if self.monitoring_callback:
-            await self.monitoring_callback(client_ip, limit, len(self.requests[client_ip]), window)
+        monitoring_callback = self.monitoring_callback
+        advanced_monitoring_report = self.advanced_monitoring_report
+        if (monitoring_callback or advanced_monitoring_report) and request_count is None:
+            request_count = self.request_count(client_ip, current_time, window)
 
-        if self.advanced_monitoring_report:
-            advanced_monitoring_data = self.generate_advanced_monitoring_data(client_ip, limit, len(self.requests[client_ip]), window, response, request)
-            await self.advanced_monitoring_report(advanced_monitoring_data)
+        if monitoring_callback:
+            await monitoring_callback(client_ip, limit, request_count, window)
+
+        if advanced_monitoring_report:
+            advanced_monitoring_data = self.generate_advanced_monitoring_data(client_ip, limit, request_count, window, response, request)
+            await advanced_monitoring_report(advanced_monitoring_data)
 
         if self.granular_rate_limit_callback:
             limit, window = await self.granular_rate_limit_callback(client_ip, endpoint)
@@ -71,20 +135,28 @@ class RateLimiter:
         return response
 
     def is_exempt_path(self, endpoint: str) -> bool:
-        return endpoint in self.exempt_paths
+        return endpoint in self._exempt_paths
 
     def is_whitelisted(self, client_ip: str) -> bool:
-        return client_ip in self.whitelist
+        return client_ip in self._whitelist
 
     async def is_bypass_token(self, request: Request) -> bool:
-        token = request.headers.get("x-bypass-token")
-        return any(token in tokens for tokens in self.rate_limit_bypass_tokens.values())
+        if not self._bypass_tokens:
+            return False
+        return request.headers.get("x-bypass-token") in self._bypass_tokens
+
+    async def get_rate_limit(self, client_ip: str, endpoint: str, current_time: Optional[int] = None) -> Tuple[int, int]:
+        if current_time is None:
+            current_time = time.monotonic_ns()
 
-    def get_rate_limit(self, client_ip: str, endpoint: str) -> Tuple[int, int]:
         # Check the cache first
-        cached_rate_limit = self.rate_limit_cache.get((client_ip, endpoint))
-        if cached_rate_limit:
-            return cached_rate_limit
+        key = (client_ip, endpoint)
+        cached = self.rate_limit_cache.get(key)
+        if cached:
+            rate_limit, expires_at = cached
+            if current_time < expires_at:
+                self.rate_limit_cache.move_to_end(key)
+                return rate_limit
 
         if endpoint in self.rate_limit_by_endpoint:
             rate_limit = self.rate_limit_by_endpoint[endpoint]
@@ -98,11 +170,17 @@ class RateLimiter:
             rate_limit = (self.default_limit, self.default_window)
 
         if self.automated_rate_limit_adjustment:
-            limit, window = self.automated_rate_limit_adjustment(client_ip, rate_limit[0], rate_limit[1])
+            if self._adjustment_is_async:
+                limit, window = await self.automated_rate_limit_adjustment(client_ip, rate_limit[0], rate_limit[1])
+            else:
+                limit, window = self.automated_rate_limit_adjustment(client_ip, rate_limit[0], rate_limit[1])
             rate_limit = (limit, window)
 
-        # Update the cache
-        self.rate_limit_cache[(client_ip, endpoint)] = rate_limit
+        # Update the cache; entries expire so adjusted and granular limits are picked up
+        self.rate_limit_cache[key] = (rate_limit, current_time + self.cache_ttl * 1_000_000_000)
+        self.rate_limit_cache.move_to_end(key)
+        if len(self.rate_limit_cache) > self.cache_size:
+            self.rate_limit_cache.popitem(last=False)
 
         return rate_limit
 
@@ -123,27 +201,74 @@ class RateLimiter:
             self.concurrent_requests[client_ip] = 0
         return self.concurrent_requests[client_ip] >= self.default_limit
 
-    def track_request(self, client_ip: str, current_time: float, window: int, limit: int) -> bool:
-        if client_ip not in self.requests:
-            self.requests[client_ip] = [current_time]
-        else:
-            client_requests = self.requests[client_ip]
-            while client_requests and client_requests[0] < current_time - window:
-                client_requests.pop(0)
-            if len(client_requests) < limit:
-                client_requests.append(current_time)
-                return True
-            return False
-        return True
+    def _roll_bucket(self, client_ip: str, current_time: int, window_ns: int) -> List[int]:
+        # Buckets are kept per client and window length, so requests under
+        # different windows never reset each other's counts. Each bucket is
+        # [previous window count, current window count, current window start].
+        bucket_start = current_time - current_time % window_ns
+        client_buckets = self.buckets.get(client_ip)
+        if client_buckets is None:
+            client_buckets = self.buckets[client_ip] = {}
+        bucket = client_buckets.get(window_ns)
+        if bucket is None:
+            bucket = client_buckets[window_ns] = [0, 0, bucket_start]
+        elif bucket[2] != bucket_start:
+            bucket[0] = bucket[1] if bucket[2] == bucket_start - window_ns else 0
+            bucket[1] = 0
+            bucket[2] = bucket_start
+        return bucket
+
+    def _estimate(self, bucket: List[int], current_time: int, window_ns: int) -> int:
+        previous, current, bucket_start = bucket
+        return previous * (window_ns - (current_time - bucket_start)) // window_ns + current
+
+    def track_request(self, client_ip: str, current_time: int, window: int, limit: int) -> bool:
+        window_ns = window * 1_000_000_000
+        bucket = self._roll_bucket(client_ip, current_time, window_ns)
+        if self._estimate(bucket, current_time, window_ns) < limit:
+            bucket[1] += 1
+            return True
+        return False
+
+    def request_count(self, client_ip: str, current_time: int, window: int) -> int:
+        window_ns = window * 1_000_000_000
+        if window_ns not in self.buckets.get(client_ip, ()):
+            return 0
+        return self._estimate(self._roll_bucket(client_ip, current_time, window_ns), current_time, window_ns)
+
+    def sweep(self, current_time: int):
+        self._requests_since_sweep = 0
+        for client_ip in list(self.buckets):
+            client_buckets = self.buckets[client_ip]
+            stale = [window_ns for window_ns, bucket in client_buckets.items() if bucket[2] < current_time - 2 * window_ns]
+            for window_ns in stale:
+                del client_buckets[window_ns]
+            if not client_buckets:
+                del self.buckets[client_ip]
+        idle = [ip for ip, count in self.concurrent_requests.items() if not count]
+        for ip in idle:
+            del self.concurrent_requests[ip]
+
+    async def track_request_redis(self, client_ip: str, window: int, limit: int) -> Tuple[bool, int]:
+        # Keyed per client and window length, the same scope as the in-process buckets.
+        now = time.time_ns()
+        member = f"{now}:{os.getpid()}:{next(self._member_ids)}"
+        allowed, request_count = await self._sliding_window(
+            keys=[f"rl:{client_ip}:{window}"],
+            args=[now // 1_000_000, window * 1000, limit, member],
+        )
+        return bool(allowed), int(request_count)
 
     def create_rate_limit_exceeded_response(
-        self, client_ip: str, limit: int, window: int, current_time: float
+        self, client_ip: str, limit: int, window: int, current_time: float, request_count: Optional[int] = None
     ) -> Response:
         error_response = TooManyRequests("Limit Exceeded")
         for header, value in self.custom_headers.items():
             error_response.headers[header] = value
         error_response.headers['X-RateLimit-Limit'] = str(limit)
-        error_response.headers['X-RateLimit-Remaining'] = str(max(0, limit - len(self.requests.get(client_ip, []))))
+        if request_count is None:
+            request_count = self.request_count(client_ip, time.monotonic_ns(), window)
+        error_response.headers['X-RateLimit-Remaining'] = str(max(0, limit - request_count))
         error_response.headers['X-RateLimit-Reset'] = str(int(current_time + window))
         return error_response
 
@@ -154,7 +279,13 @@ class RateLimiter:
 
     def clear_rate_limit(self, client_ip: str):
         self.rate_limits.pop(client_ip, None)
-        self.requests.pop(client_ip, None)
+        self.buckets.pop(client_ip, None)
+
+    async def clear_rate_limit_redis(self, client_ip: str, window: int):
+        try:
+            await self._redis.delete(f"rl:{client_ip}:{window}")
+        except RedisError as e:
+            logger.warning("Failed to clear Redis rate limit for %s: %s", client_ip, e)
 
     def get_rate_limit_expiry_time(self, client_ip: str, endpoint: str) -> int:
         if endpoint in self.rate_limit_expiry_policies:
@@ -1,6 +1,7 @@
 import datetime
 import logging
 import os
+import re
 from logging.handlers import TimedRotatingFileHandler
 from typing import Optional
 
@@ -23,6 +24,10 @@ class LoggingMiddleware:
         self.timestamp_format = _settings.get('timestamp_format') or "%Y-%m-%d %H:%M:%S"
         self.log_response_time = _settings.get('log_response_time') or True
         self.url_patterns_to_log = _settings.get('url_patterns_to_log') or []
+        self._url_patterns_re = (
+            re.compile('|'.join(map(re.escape, self.url_patterns_to_log)))
+            if self.url_patterns_to_log else None
+        )
 
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
@@ -77,13 +82,10 @@ class LoggingMiddleware:
             self.logger.info(log_message)
 
     def _should_log_request(self, request):
-        if not self.url_patterns_to_log:
+        if self._url_patterns_re is None:
             return True
 
-        for pattern in self.url_patterns_to_log:
-            if pattern in request.url:
-                return True
-        return False
+        return self._url_patterns_re.search(str(request.url)) is not None
 
     def _create_log_entry(self, request):
         log_entry = {
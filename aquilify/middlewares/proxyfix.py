@@ -1,6 +1,7 @@
 from typing import List, Tuple
 
 from ..wrappers import Request, Response
+from ..utils.network import IPSet
 
 class ProxyFix:
     def __init__(
@@ -14,6 +15,7 @@ class ProxyFix:
         self.app = app
         self.num_proxies = num_proxies
         self.trusted_proxies = set(trusted_proxies) if trusted_proxies else set()
+        self._trusted_proxies = IPSet(self.trusted_proxies)
         self.headers_to_check = headers_to_check or ['x-forwarded-for', 'x-real-ip', 'forwarded']
         self.trusted_hostnames = set(trusted_hostnames) if trusted_hostnames else set()
 
@@ -65,7 +67,7 @@ class ProxyFix:
         return ''
 
     def is_trusted_proxy(self, remote_address: str) -> bool:
-        return remote_address in self.trusted_proxies
+        return remote_address in self._trusted_proxies
 
     def remove_header_to_check(self, header_name: str) -> None:
         if header_name in self.headers_to_check:
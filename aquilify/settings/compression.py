@@ -14,6 +14,7 @@ class CompressionSetting:
 
             variables_to_import = [
                 'GZIP_COMPRESSION_LEVEL',
+                'GZIP_COMPRESSION_TIER',
                 'GZIP_COMPRESSION_CONTENT_TYPES',
                 'GZIP_IGNORE_CONTENT_LENGHT',
                 'GZIP_CONTENT_ENCODING',
@@ -15,6 +15,7 @@ class CSPConfigSettings:
             report_sample_weight = getattr(settings, "CSP_REPORT_SAMPLE_WEIGHT", 0.0)
             violation_report_endpoint = getattr(settings, "CSP_VIOLATION_REPORT_ENDPOINT", '/violation-report')
             log_file_path = getattr(settings, "CSP_LOG_FILE_PATH", 'csp_report.log')
+            max_violation_reports = getattr(settings, "CSP_MAX_VIOLATION_REPORTS", 10000)
             security_headers = getattr(settings, "CSP_SECURITY_HEADERS", None)
             nonce_length = getattr(settings, "CSP_NONCE_LENGTH", 16)
             nonce_algorithm = getattr(settings, "CSP_NONCE_ALGORITHM", 'sha256')
@@ -42,6 +43,7 @@ class CSPConfigSettings:
                 "report_sample_weight": report_sample_weight,
                 "violation_report_endpoint": violation_report_endpoint,
                 "log_file_path": log_file_path,
+                "max_violation_reports": max_violation_reports,
                 "security_headers": security_headers,
                 "nonce_length": nonce_length,
                 "nonce_algorithm": nonce_algorithm,
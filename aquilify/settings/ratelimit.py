@@ -26,6 +26,7 @@ class RateLimitConfigSettings:
             automated_asjustments = self._fetch_response_handler_functions("RATE_LIMITER_AUTOMATED_ADJUSTMENTS") or None
             advance_monitiring_and_reporting = self._fetch_response_handler_functions("RATE_LIMITER_ADVANCE_MONITORING_AND_REPORTING") or None
             granular_callback = self._fetch_response_handler_functions("RATE_LIMITER_GRANULAR_CALLBACK") or None
+            redis_url = getattr(settings, 'RATE_LIMITER_REDIS_URL', None)
 
             rate_limit_dict = {
                 'limit': limit,
@@ -46,7 +47,8 @@ class RateLimitConfigSettings:
                 'granular': granular,
                 'automated_adjustments': automated_asjustments,
                 'advance_monitoring_and_reporting': advance_monitiring_and_reporting,
-                'granular_callback': granular_callback
+                'granular_callback': granular_callback,
+                'redis_url': redis_url
             }
             return rate_limit_dict
                     
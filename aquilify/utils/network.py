@@ -0,0 +1,51 @@
+import ipaddress
+from typing import Any, Dict, Iterable, Set
+
+
+class IPSet:
+    """
+    Membership set of IP addresses and CIDR networks.
+
+    Addresses are normalised through ``ipaddress`` so equivalent spellings
+    (e.g. ``::1`` and ``0:0::1``) match. Plain addresses are matched with a
+    single set lookup. Networks are grouped by prefix length, so a lookup
+    costs one masked set probe per distinct prefix length instead of one
+    comparison per network.
+    """
+
+    def __init__(self, entries: Iterable[str] = ()) -> None:
+        self._addresses: Set[Any] = set()
+        self._networks: Dict[int, Dict[int, Set[int]]] = {4: {}, 6: {}}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: str) -> None:
+        try:
+            network = ipaddress.ip_network(entry, strict=False)
+        except (TypeError, ValueError):
+            # Not an IP address or network; match it as an exact string.
+            self._addresses.add(entry)
+            return
+
+        if network.prefixlen == network.max_prefixlen:
+            self._addresses.add(network.network_address)
+            return
+
+        shift = network.max_prefixlen - network.prefixlen
+        prefixes = self._networks[network.version].setdefault(shift, set())
+        prefixes.add(int(network.network_address) >> shift)
+
+    def __contains__(self, address: Any) -> bool:
+        try:
+            ip = ipaddress.ip_address(address)
+        except (TypeError, ValueError):
+            return address in self._addresses
+
+        if ip in self._addresses:
+            return True
+
+        value = int(ip)
+        for shift, prefixes in self._networks[ip.version].items():
+            if value >> shift in prefixes:
+                return True
+        return False
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import json
 import secrets
-import gzip 
-import io
+import gzip
+import zlib
 
 from typing import Optional, List, Union, Callable, Type, Any, Dict
 from datetime import datetime, timedelta
@@ -44,16 +44,17 @@ class Response:
         response_headers = {key.encode() if isinstance(key, str) else key: value.encode() if isinstance(value, str) else value for key, value in response_headers.items()}
 
         try:
-            content_length = 0
-            if self.content:
-                if isinstance(self.content, str):
-                    content_length = len(self.content.encode('utf-8'))
-                elif isinstance(self.content, bytes):
-                    content_length = len(self.content)
-                elif callable(self.content):
-                    content_length = await self.get_stream_content_length(scope, receive, send)
+            if b'Transfer-Encoding' not in response_headers:
+                content_length = 0
+                if self.content:
+                    if isinstance(self.content, str):
+                        content_length = len(self.content.encode('utf-8'))
+                    elif isinstance(self.content, bytes):
+                        content_length = len(self.content)
+                    elif callable(self.content):
+                        content_length = await self.get_stream_content_length(scope, receive, send)
 
-            response_headers[b'Content-Length'] = str(content_length).encode()
+                response_headers[b'Content-Length'] = str(content_length).encode()
             
             if self.compress:
                 response_headers[b'Content-Encoding'] = b'gzip'
@@ -86,19 +87,20 @@ class Response:
     async def _send_streaming_response_compressed(self, scope, receive, send):
         try:
             if callable(self.content):
-                gzip_buffer = io.BytesIO()
-                gzip_stream = gzip.GzipFile(fileobj=gzip_buffer, mode='w')
+                compressor = zlib.compressobj(9, zlib.DEFLATED, 31)
                 async for chunk in self.content(scope, receive, send):
-                    gzip_stream.write(chunk)
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode('utf-8')
                     await send({
                         'type': 'http.response.body',
-                        'body': gzip_buffer.getvalue(),
+                        'body': compressor.compress(chunk),
                         'more_body': True,
                     })
-                    gzip_buffer.truncate(0)
-                    gzip_buffer.seek(0)
 
-                gzip_stream.close()
+                await send({
+                    'type': 'http.response.body',
+                    'body': compressor.flush(),
+                })
         except Exception as e:
             await handle_exception(e)
 
@@ -136,7 +138,12 @@ class Response:
                     await send({
                         'type': 'http.response.body',
                         'body': chunk.encode('utf-8') if isinstance(chunk, str) else chunk,
+                        'more_body': True,
                     })
+                await send({
+                    'type': 'http.response.body',
+                    'body': b'',
+                })
 
         except Exception as e:
             await handle_exception(e)